@@ -1,9 +1,11 @@
 import os
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.infrastructure.container.dependency_container import get_container, cleanup_container
 from src.presentation.api.controllers import router as api_router
@@ -11,15 +13,24 @@ from src.presentation.api.controllers import router as api_router
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# uvloop quando disponível (não existe no Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 Iniciando Curriculum Analyzer API...")
     try:
         container = await get_container()
+        # Reaproveitado pela dependência dos endpoints em cada requisição
+        app.state.container = container
         logger.info("✅ Container iniciado")
         repository = container.get_repository()
-        await repository.list_documents(limit=1)
+        await repository.ping()
         logger.info("✅ Database OK")
         yield
     except Exception as e:
@@ -35,7 +46,8 @@ app = FastAPI(
     title="Curriculum Analyzer API",
     description="API para análise de currículos com OCR e LLM usando Clean Architecture",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
@@ -50,4 +62,14 @@ if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
-    uvicorn.run("main:app", host=host, port=port, reload=True)
\ No newline at end of file
+    reload = os.getenv("RELOAD", "0") == "1"
+    workers = int(os.getenv("WORKERS", str(max(1, os.cpu_count() or 2))))
+    uvicorn.run(
+        "main:app",
+        host=host,
+        port=port,
+        reload=reload,
+        workers=1 if reload else workers,
+        loop="auto",
+        http="auto"
+    )
\ No newline at end of file
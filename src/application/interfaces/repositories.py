@@ -3,7 +3,8 @@ Interfaces de Repositórios
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from ...domain.entities.curriculum import CurriculumDocument, CurriculumAnalysis, ProcessingAudit
 
@@ -13,6 +14,11 @@ class ICurriculumRepository(ABC):
     Interface para repositório de currículos
     """
     
+    @abstractmethod
+    async def ping(self) -> bool:
+        """Verifica se o banco de dados está acessível"""
+        pass
+    
     @abstractmethod
     async def save_document(self, document: CurriculumDocument) -> None:
         """Salva um documento de currículo"""
@@ -24,8 +30,41 @@ class ICurriculumRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_documents(self, limit: int = 100, offset: int = 0) -> List[CurriculumDocument]:
-        """Lista documentos com paginação"""
+    async def get_document_meta(self, document_id: str) -> Optional[CurriculumDocument]:
+        """Recupera um documento por ID sem carregar o texto extraído"""
+        pass
+    
+    @abstractmethod
+    async def get_document_with_analysis(
+        self,
+        document_id: str
+    ) -> Tuple[Optional[CurriculumDocument], Optional[CurriculumAnalysis]]:
+        """Recupera os metadados de um documento e sua análise em uma única consulta"""
+        pass
+    
+    @abstractmethod
+    async def get_documents(self, document_ids: List[str]) -> Dict[str, CurriculumDocument]:
+        """Recupera vários documentos por ID em uma única consulta"""
+        pass
+    
+    @abstractmethod
+    async def list_documents(self, limit: int = 100, after: Optional[Tuple[datetime, str]] = None) -> List[CurriculumDocument]:
+        """Lista documentos a partir de (upload_timestamp, id) do último da página anterior"""
+        pass
+    
+    @abstractmethod
+    async def list_document_infos(self, limit: int = 100, after: Optional[Tuple[datetime, str]] = None) -> List[dict]:
+        """Lista só os metadados dos documentos (sem o texto extraído), na ordem de list_documents"""
+        pass
+    
+    @abstractmethod
+    async def list_document_ids(self, limit: int = 100) -> List[str]:
+        """Lista os IDs dos documentos mais recentes, na ordem de list_documents"""
+        pass
+    
+    @abstractmethod
+    def iter_documents(self, limit: int = 1000, after: Optional[Tuple[datetime, str]] = None) -> AsyncIterator[CurriculumDocument]:
+        """Itera documentos sob demanda, sem carregar a página inteira nem o texto extraído"""
         pass
     
     @abstractmethod
@@ -43,6 +82,11 @@ class ICurriculumRepository(ABC):
         """Salva uma análise de currículo"""
         pass
     
+    @abstractmethod
+    async def save_analyses(self, analyses: List[CurriculumAnalysis]) -> None:
+        """Salva várias análises em uma única escrita"""
+        pass
+    
     @abstractmethod
     async def get_analysis(self, analysis_id: str) -> Optional[CurriculumAnalysis]:
         """Recupera uma análise por ID"""
@@ -54,8 +98,23 @@ class ICurriculumRepository(ABC):
         pass
     
     @abstractmethod
-    async def list_analyses(self, limit: int = 100, offset: int = 0) -> List[CurriculumAnalysis]:
-        """Lista análises com paginação"""
+    async def get_analyses_by_documents(self, document_ids: List[str]) -> Dict[str, CurriculumAnalysis]:
+        """Recupera análises de vários documentos em uma única consulta"""
+        pass
+    
+    @abstractmethod
+    async def get_analysis_by_content_hash(self, content_hash: str) -> Optional[CurriculumAnalysis]:
+        """Recupera uma análise pelo hash do texto analisado"""
+        pass
+    
+    @abstractmethod
+    async def list_analyses(self, limit: int = 100, after: Optional[Tuple[datetime, str]] = None) -> List[CurriculumAnalysis]:
+        """Lista análises a partir de (analysis_timestamp, id) da última da página anterior"""
+        pass
+    
+    @abstractmethod
+    def iter_analyses(self, limit: int = 1000, after: Optional[Tuple[datetime, str]] = None) -> AsyncIterator[CurriculumAnalysis]:
+        """Itera análises sob demanda, sem carregar a página inteira"""
         pass
     
     @abstractmethod
@@ -64,6 +123,31 @@ class ICurriculumRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_audit_history(self, document_id: str = None, limit: int = 100) -> List[ProcessingAudit]:
-        """Recupera histórico de auditoria"""
+    async def save_audits(self, audits: List[ProcessingAudit]) -> None:
+        """Salva vários registros de auditoria em uma única escrita"""
+        pass
+    
+    @abstractmethod
+    async def count_documents_estimated(self) -> int:
+        """Total aproximado de documentos, sem varrer a coleção"""
+        pass
+    
+    @abstractmethod
+    async def count_analyses_estimated(self) -> int:
+        """Total aproximado de análises, sem varrer a coleção"""
+        pass
+    
+    @abstractmethod
+    async def count_audits(self, document_id: Optional[str] = None) -> int:
+        """Total de registros de auditoria, opcionalmente de um documento"""
+        pass
+    
+    @abstractmethod
+    async def get_audit_history(
+        self,
+        document_id: str = None,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, str]] = None
+    ) -> List[ProcessingAudit]:
+        """Recupera histórico de auditoria a partir de (timestamp, id) do último da página anterior"""
         pass
\ No newline at end of file
@@ -5,7 +5,7 @@ Interfaces de serviços da aplicação
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from ...domain.entities.curriculum import CurriculumDocument, CurriculumAnalysis, AnalysisRequest, AnalysisResult
+from ...domain.entities.curriculum import CurriculumDocument, CurriculumAnalysis, AnalysisRequest, AnalysisResult, ProcessingAudit
 from ...domain.value_objects.curriculum_values import FileType, TechnicalSkillSet, ExperienceYears, ProfessionalLevel
 
 
@@ -52,6 +52,15 @@ class IIntelligenceService(ABC):
         pass
     
     @abstractmethod
-    def analyze_query_match(self, analyses: List[CurriculumAnalysis], query: str) -> dict:
-        """Analisa match com query específica"""
-        pass
\ No newline at end of file
+    def analyze_query_match(self, analyses: List[CurriculumAnalysis], query: str, top_k: Optional[int] = None) -> dict:
+        """Analisa match com query específica, retornando os top_k melhores (todos se None)"""
+        pass
+
+
+class IAuditWriter(ABC):
+    """Interface para gravação assíncrona de auditorias"""
+    
+    @abstractmethod
+    def enqueue(self, audit: ProcessingAudit) -> None:
+        """Enfileira uma auditoria para gravação em segundo plano"""
+        pass
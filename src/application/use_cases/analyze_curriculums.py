@@ -1,9 +1,13 @@
 import time
-from typing import List, Optional, Dict, Any
+import asyncio
+import hashlib
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
+from cachetools import LFUCache, TTLCache
+
 from ...domain.entities.curriculum import CurriculumDocument, CurriculumAnalysis, ProcessingAudit
-from ..interfaces.services import ITextExtractionService, IIntelligenceService
+from ..interfaces.services import ITextExtractionService, IIntelligenceService, IAuditWriter
 from ..interfaces.repositories import ICurriculumRepository
 
 @dataclass
@@ -16,15 +20,23 @@ class AnalysisExecutionResult:
 
 
 class AnalyzeCurriculumsUseCase:
-    def __init__(self, text_extraction_service: ITextExtractionService, intelligence_service: IIntelligenceService, audit_repository: ICurriculumRepository):
+    def __init__(self, text_extraction_service: ITextExtractionService, intelligence_service: IIntelligenceService, audit_repository: ICurriculumRepository, audit_writer: IAuditWriter, max_concurrency: int = 8):
         self.text_extraction_service = text_extraction_service
         self.intelligence_service = intelligence_service
         self.repository = audit_repository
+        self.audit_writer = audit_writer
+        self.max_concurrency = max(1, max_concurrency)
+        # Cache em memória de análises por hash do texto extraído
+        self._analysis_cache: LFUCache = LFUCache(maxsize=1024)
+        # Cache de resultados de matching por (query, conjunto de análises)
+        self._match_cache: TTLCache = TTLCache(maxsize=2048, ttl=3600)
     
     async def execute(
         self, 
         document_ids: List[str], 
-        query: Optional[str] = None
+        query: Optional[str] = None,
+        use_cache: bool = True,
+        top_k: Optional[int] = None
     ) -> AnalysisExecutionResult:
         """
         Executa a análise de currículos
@@ -32,70 +44,75 @@ class AnalyzeCurriculumsUseCase:
         Args:
             document_ids: Lista de IDs dos documentos para analisar
             query: Query opcional para matching
+            use_cache: Se False, ignora o cache de matching
+            top_k: Quantidade máxima de candidatos no ranking (todos se None)
             
         Returns:
             Resultado da análise
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         analyses = []
         matching_results = None
         
         try:
-            # Processar cada documento
-            for doc_id in document_ids:
-                try:
-                    # Buscar documento
-                    document = await self.repository.get_document(doc_id)
-                    if not document:
-                        continue
-                    
-                    # Verificar se já foi processado
-                    existing_analysis = await self.repository.get_analysis_by_document(doc_id)
-                    if existing_analysis:
-                        analyses.append(existing_analysis)
-                        continue
-                    
-                    # Extrair texto se necessário
-                    if not document.processed:
-                        # Simular conteúdo do arquivo para extração
-                        text = await self.text_extraction_service.extract_from_bytes(
-                            b"",  # Placeholder - em produção seria o conteúdo real
-                            document.file_type
-                        )
-                        document.mark_as_processed(text)
-                        await self.repository.update_document(document)
-                    
-                    # Analisar com inteligência
-                    analysis = self.intelligence_service.analyze_curriculum(document)
-                    
-                    # Salvar análise
-                    await self.repository.save_analysis(analysis)
-                    analyses.append(analysis)
-                    
-                    # Criar auditoria de sucesso
-                    audit = ProcessingAudit.create_success(
-                        action="document_analysis",
-                        document_id=doc_id,
-                        processing_time_ms=int((time.time() - start_time) * 1000)
+            # Ids repetidos gerariam análises duplicadas (e um save_analyses rejeitado pelo índice único)
+            document_ids = list(dict.fromkeys(document_ids))
+            
+            # Buscar documentos e análises existentes em lote
+            documents, existing_analyses = await asyncio.gather(
+                self.repository.get_documents(document_ids),
+                self.repository.get_analyses_by_documents(document_ids)
+            )
+            
+            # Processar documentos concorrentemente, limitado pelo semáforo
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            results = await asyncio.gather(
+                *[
+                    self._process_one(
+                        documents.get(doc_id),
+                        existing_analyses.get(doc_id),
+                        start_ns,
+                        semaphore
                     )
-                    await self.repository.save_audit(audit)
-                    
-                except Exception as e:
-                    # Criar auditoria de erro
-                    audit = ProcessingAudit.create_error(
+                    for doc_id in document_ids
+                ],
+                return_exceptions=True
+            )
+            
+            audits = []
+            analyses_to_save = []
+            for doc_id, result in zip(document_ids, results):
+                if isinstance(result, BaseException):
+                    audits.append(ProcessingAudit.create_error(
                         action="document_analysis",
-                        error_message=str(e),
+                        error_message=str(result),
                         document_id=doc_id,
-                        processing_time_ms=int((time.time() - start_time) * 1000)
-                    )
-                    await self.repository.save_audit(audit)
+                        processing_time_ms=self._elapsed_ms(start_ns)
+                    ))
                     continue
+                
+                analysis, audit = result
+                if analysis:
+                    analyses.append(analysis)
+                    # Análises novas vêm acompanhadas de auditoria de sucesso
+                    if audit and audit.success:
+                        analyses_to_save.append(analysis)
+                if audit:
+                    audits.append(audit)
+            
+            # Auditorias são gravadas em segundo plano; enfileiradas antes do save para
+            # não se perderem se ele falhar
+            for audit in audits:
+                self.audit_writer.enqueue(audit)
+            
+            # Salvar análises em lote
+            await self.repository.save_analyses(analyses_to_save)
             
             # Análise de matching se query fornecida
             if query and analyses:
-                matching_results = self.intelligence_service.analyze_query_match(analyses, query)
+                matching_results = self._analyze_query_match(analyses, query, use_cache, top_k)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = self._elapsed_ms(start_ns)
             
             return AnalysisExecutionResult(
                 analyses=analyses,
@@ -105,7 +122,7 @@ class AnalyzeCurriculumsUseCase:
             )
             
         except Exception as e:
-            processing_time = int((time.time() - start_time) * 1000)
+            processing_time = self._elapsed_ms(start_ns)
             
             # Auditoria de erro geral
             audit = ProcessingAudit.create_error(
@@ -113,11 +130,139 @@ class AnalyzeCurriculumsUseCase:
                 error_message=str(e),
                 processing_time_ms=processing_time
             )
-            await self.repository.save_audit(audit)
+            self.audit_writer.enqueue(audit)
             
             return AnalysisExecutionResult(
                 analyses=[],
                 processing_time_ms=processing_time,
                 success=False,
                 error_message=str(e)
-            )
\ No newline at end of file
+            )
+    
+    async def _process_one(
+        self,
+        document: Optional[CurriculumDocument],
+        existing_analysis: Optional[CurriculumAnalysis],
+        start_ns: int,
+        semaphore: asyncio.Semaphore
+    ) -> Tuple[Optional[CurriculumAnalysis], Optional[ProcessingAudit]]:
+        """
+        Processa um único documento
+        
+        Args:
+            document: Documento já carregado (None se não encontrado)
+            existing_analysis: Análise já existente para o documento
+            start_ns: Início do processamento do lote (time.monotonic_ns)
+            semaphore: Semáforo que limita a concorrência
+            
+        Returns:
+            Tupla (análise ou None, auditoria ou None)
+        """
+        if not document:
+            return None, None
+        
+        # Verificar se já foi processado
+        if existing_analysis:
+            return existing_analysis, None
+        
+        doc_id = document.id
+        async with semaphore:
+            try:
+                # O texto é extraído no upload; o conteúdo original não é armazenado
+                if not document.processed:
+                    raise ValueError(document.error_message or "Documento sem texto extraído")
+                
+                # Reaproveitar análise de texto idêntico, se houver
+                content_hash = self._content_hash(document.extracted_text)
+                analysis = await self._get_cached_analysis(content_hash, doc_id)
+                
+                if analysis is None:
+                    # Analisar com inteligência fora do event loop
+                    analysis = await asyncio.to_thread(self.intelligence_service.analyze_curriculum, document)
+                    analysis.content_hash = content_hash
+                    if content_hash:
+                        self._analysis_cache[content_hash] = analysis
+                
+                # Criar auditoria de sucesso
+                audit = ProcessingAudit.create_success(
+                    action="document_analysis",
+                    document_id=doc_id,
+                    processing_time_ms=self._elapsed_ms(start_ns)
+                )
+                return analysis, audit
+                
+            except Exception as e:
+                # Criar auditoria de erro
+                audit = ProcessingAudit.create_error(
+                    action="document_analysis",
+                    error_message=str(e),
+                    document_id=doc_id,
+                    processing_time_ms=self._elapsed_ms(start_ns)
+                )
+                return None, audit
+    
+    def _analyze_query_match(
+        self,
+        analyses: List[CurriculumAnalysis],
+        query: str,
+        use_cache: bool,
+        top_k: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Executa o matching, reaproveitando resultados da mesma query e análises
+        
+        Args:
+            analyses: Análises dos currículos
+            query: Query para matching
+            use_cache: Se False, sempre recalcula
+            top_k: Quantidade máxima de candidatos no ranking
+            
+        Returns:
+            Resultado do matching
+        """
+        fingerprint = f"{query}|{top_k}|" + ",".join(sorted(a.id for a in analyses))
+        key = hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+        
+        if use_cache:
+            cached = self._match_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        result = self.intelligence_service.analyze_query_match(analyses, query, top_k)
+        self._match_cache[key] = result
+        return result
+    
+    @staticmethod
+    def _elapsed_ms(start_ns: int) -> int:
+        """Tempo decorrido em milissegundos desde start_ns"""
+        return (time.monotonic_ns() - start_ns) // 1_000_000
+    
+    @staticmethod
+    def _content_hash(text: str) -> Optional[str]:
+        """Calcula o hash do texto extraído (None para texto vazio)"""
+        if not text or not text.strip():
+            return None
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    
+    async def _get_cached_analysis(self, content_hash: Optional[str], document_id: str) -> Optional[CurriculumAnalysis]:
+        """
+        Busca uma análise já feita para o mesmo texto
+        
+        Args:
+            content_hash: Hash do texto extraído
+            document_id: ID do documento que receberá a análise
+            
+        Returns:
+            Cópia da análise para o documento ou None
+        """
+        if not content_hash:
+            return None
+        
+        cached = self._analysis_cache.get(content_hash)
+        if cached is None:
+            cached = await self.repository.get_analysis_by_content_hash(content_hash)
+            if cached is None:
+                return None
+            self._analysis_cache[content_hash] = cached
+        
+        return cached.copy_for_document(document_id)
@@ -2,9 +2,11 @@
 Use Cases para operações de auditoria
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from ..interfaces.repositories import ICurriculumRepository
+from ..interfaces.services import IAuditWriter
 from ...domain.entities.curriculum import ProcessingAudit
 
 
@@ -13,17 +15,17 @@ class CreateAuditUseCase:
     Use Case para criar registros de auditoria
     """
     
-    def __init__(self, repository: ICurriculumRepository):
-        self.repository = repository
+    def __init__(self, audit_writer: IAuditWriter):
+        self.audit_writer = audit_writer
     
     async def execute(self, audit: ProcessingAudit) -> None:
         """
-        Executa criação de auditoria
+        Executa criação de auditoria (gravada em segundo plano)
         
         Args:
             audit: Registro de auditoria
         """
-        await self.repository.save_audit(audit)
+        self.audit_writer.enqueue(audit)
 
 
 class GetAuditHistoryUseCase:
@@ -37,7 +39,8 @@ class GetAuditHistoryUseCase:
     async def execute(
         self,
         document_id: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[datetime, str]] = None
     ) -> List[ProcessingAudit]:
         """
         Executa recuperação de histórico
@@ -45,11 +48,13 @@ class GetAuditHistoryUseCase:
         Args:
             document_id: ID do documento (opcional)
             limit: Limite de registros
+            after: (timestamp, id) do último registro da página anterior (opcional)
             
         Returns:
             Lista de registros de auditoria
         """
         return await self.repository.get_audit_history(
             document_id=document_id,
-            limit=limit
+            limit=limit,
+            after=after
         )
\ No newline at end of file
@@ -1,13 +1,20 @@
 from datetime import datetime
-from typing import List, Optional
-from dataclasses import dataclass, field
-import uuid
+from typing import List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+import os
+import secrets
 
 from ..value_objects.curriculum_values import FileType
 
-@dataclass
+
+def _new_id() -> str:
+    """Gera um ID aleatório de 128 bits em hexadecimal"""
+    return secrets.token_hex(16)
+
+
+@dataclass(slots=True)
 class CurriculumDocument:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     file_name: str = ""
     file_type: FileType = FileType.UNKNOWN
     file_size: int = 0
@@ -21,7 +28,8 @@ class CurriculumDocument:
         return bool(self.file_name and self.file_size > 0 and self.file_type != FileType.UNKNOWN)
     
     def get_file_extension(self) -> str:
-        return self.file_name.split('.')[-1].lower() if '.' in self.file_name else ""
+        ext = os.path.splitext(self.file_name)[1]
+        return ext[1:].lower() if ext else ""
     
     def mark_as_processed(self, extracted_text: str) -> None:
         self.extracted_text = extracted_text
@@ -39,12 +47,12 @@ class CurriculumDocument:
         return cls(file_name=file_name, file_type=file_type, file_size=file_size)
 
 
-@dataclass
+@dataclass(slots=True)
 class CurriculumAnalysis:
     """
     Entidade que representa a análise de um currículo
     """
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     document_id: str = ""
     summary: str = ""
     skills: List[str] = field(default_factory=list)
@@ -52,23 +60,41 @@ class CurriculumAnalysis:
     position_level: Optional[str] = None
     education: Optional[str] = None
     analysis_timestamp: datetime = field(default_factory=datetime.now)
+    content_hash: Optional[str] = None
+    _skills_lower: Optional[set] = field(default=None, init=False, repr=False, compare=False)
+    
+    def copy_for_document(self, document_id: str) -> 'CurriculumAnalysis':
+        """Cria uma nova análise com o mesmo conteúdo para outro documento"""
+        return CurriculumAnalysis(
+            document_id=document_id,
+            summary=self.summary,
+            skills=list(self.skills),
+            experience_years=self.experience_years,
+            position_level=self.position_level,
+            education=self.education,
+            content_hash=self.content_hash
+        )
     
     def add_skill(self, skill: str) -> None:
         """Adiciona uma habilidade se não existir"""
         if skill and skill not in self.skills:
             self.skills.append(skill)
+            if self._skills_lower is not None:
+                self._skills_lower.add(skill.lower())
     
     def has_skill(self, skill: str) -> bool:
         """Verifica se possui uma habilidade"""
-        return skill.lower() in [s.lower() for s in self.skills]
+        if self._skills_lower is None:
+            self._skills_lower = {s.lower() for s in self.skills}
+        return skill.lower() in self._skills_lower
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisRequest:
     """
     Entidade que representa uma requisição de análise
     """
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     user_id: str = ""
     query: Optional[str] = None
     documents: List[CurriculumDocument] = field(default_factory=list)
@@ -88,22 +114,23 @@ class AnalysisRequest:
         return bool(self.query and self.query.strip())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QueryMatch:
     """
     Entidade que representa um match entre currículo e query
     """
     document_id: str
     score: float
-    reasons: List[str] = field(default_factory=list)
+    reasons: Tuple[str, ...] = ()
     
-    def add_reason(self, reason: str) -> None:
-        """Adiciona uma razão do match"""
-        if reason and reason not in self.reasons:
-            self.reasons.append(reason)
+    def with_reason(self, reason: str) -> 'QueryMatch':
+        """Retorna um novo match com a razão adicionada"""
+        if not reason or reason in self.reasons:
+            return self
+        return replace(self, reasons=self.reasons + (reason,))
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """
     Entidade que representa o resultado completo de uma análise
@@ -136,7 +163,7 @@ class AnalysisResult:
         self.error_message = error
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageAudit:
     """
     Entidade para auditoria de uso do sistema
@@ -168,19 +195,20 @@ class UsageAudit:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingAudit:
     """
     Entidade para auditoria de operações de processamento
     """
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     action: str = ""
     document_id: Optional[str] = None
     success: bool = False
     error_message: Optional[str] = None
     processing_time_ms: int = 0
-    timestamp: datetime = field(default_factory=datetime.now)
-    metadata: Optional[dict] = field(default_factory=dict)
+    # Preenchido pelo repositório no momento da gravação
+    timestamp: Optional[datetime] = None
+    metadata: Optional[dict] = None
     
     @classmethod
     def create_success(
@@ -196,7 +224,7 @@ class ProcessingAudit:
             document_id=document_id,
             success=True,
             processing_time_ms=processing_time_ms,
-            metadata=metadata or {}
+            metadata=metadata
         )
     
     @classmethod
@@ -215,5 +243,5 @@ class ProcessingAudit:
             success=False,
             error_message=error_message,
             processing_time_ms=processing_time_ms,
-            metadata=metadata or {}
+            metadata=metadata
         )
\ No newline at end of file
@@ -2,11 +2,23 @@
 Value Objects - Objetos de valor imutáveis
 """
 
-from dataclasses import dataclass
-from typing import Set, List
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
 from enum import Enum
 
 
+# Padrões para encontrar anos de experiência, em ordem de prioridade
+_EXPERIENCE_PATTERNS = tuple(re.compile(p) for p in (
+    r'(\d+)\s*anos?\s*de\s*experiência',
+    r'experiência\s*de\s*(\d+)\s*anos?',
+    r'(\d+)\s*years?\s*of\s*experience',
+    r'(\d+)\+\s*anos?',
+))
+
+
 class FileType(Enum):
     """Tipos de arquivo suportados"""
     PDF = "application/pdf"
@@ -22,31 +34,14 @@ class FileType(Enum):
     @classmethod
     def from_filename(cls, filename: str) -> 'FileType':
         """Determina o tipo de arquivo pela extensão"""
-        if not filename or '.' not in filename:
+        if not filename:
             return cls.UNKNOWN
         
-        extension = filename.split('.')[-1].lower()
-        
-        extension_map = {
-            'pdf': cls.PDF,
-            'jpg': cls.JPG,
-            'jpeg': cls.JPEG,
-            'png': cls.PNG,
-            'bmp': cls.BMP,
-            'tiff': cls.TIFF,
-            'gif': cls.GIF,
-            'webp': cls.WEBP,
-        }
-        
-        return extension_map.get(extension, cls.UNKNOWN)
+        return _from_filename_cached(filename)
     
     def is_image(self) -> bool:
         """Verifica se é um tipo de imagem"""
-        image_types = {
-            self.JPEG, self.JPG, self.PNG, self.BMP, 
-            self.TIFF, self.GIF, self.WEBP
-        }
-        return self in image_types
+        return self in _IMAGE_TYPES
     
     def is_pdf(self) -> bool:
         """Verifica se é PDF"""
@@ -57,6 +52,38 @@ class FileType(Enum):
         return self != self.UNKNOWN
 
 
+_EXTENSION_MAP = {
+    'pdf': FileType.PDF,
+    'jpg': FileType.JPG,
+    'jpeg': FileType.JPEG,
+    'png': FileType.PNG,
+    'bmp': FileType.BMP,
+    'tiff': FileType.TIFF,
+    'gif': FileType.GIF,
+    'webp': FileType.WEBP,
+}
+
+_IMAGE_TYPES = frozenset({
+    FileType.JPEG, FileType.JPG, FileType.PNG, FileType.BMP,
+    FileType.TIFF, FileType.GIF, FileType.WEBP
+})
+
+
+@lru_cache(maxsize=1024)
+def _from_filename_cached(filename: str) -> FileType:
+    """Implementação memoizada de FileType.from_filename"""
+    _, sep, extension = filename.rpartition('.')
+    if not sep:
+        return FileType.UNKNOWN
+    
+    return _EXTENSION_MAP.get(extension.lower(), FileType.UNKNOWN)
+
+
+# Palavras-chave de nível usadas por ProfessionalLevel.from_text
+_SENIOR_WORDS = ('senior', 'sênior', 'lead', 'líder', 'arquiteto')
+_JUNIOR_WORDS = ('junior', 'júnior', 'trainee', 'estagiário')
+
+
 class ProfessionalLevel(Enum):
     """Níveis profissionais"""
     JUNIOR = "Júnior"
@@ -70,89 +97,149 @@ class ProfessionalLevel(Enum):
         """Determina o nível a partir de texto"""
         if not text:
             return cls.UNKNOWN
+        return cls.from_lower_text(text.lower())
+    
+    @classmethod
+    def from_lower_text(cls, text_lower: str) -> 'ProfessionalLevel':
+        """Determina o nível a partir de texto já em minúsculas"""
+        # Uma única varredura; em caso de vários níveis vence o de maior prioridade
+        best = None
+        for match in _LEVEL_RE.finditer(text_lower):
+            level = _LEVEL_BY_WORD[match.group()]
+            if level is cls.SENIOR:
+                return level
+            if best is None or _LEVEL_PRIORITY[level] < _LEVEL_PRIORITY[best]:
+                best = level
         
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ['senior', 'sênior', 'lead', 'líder', 'arquiteto']):
-            return cls.SENIOR
-        elif any(word in text_lower for word in ['junior', 'júnior', 'trainee', 'estagiário']):
-            return cls.JUNIOR
-        elif 'pleno' in text_lower:
-            return cls.PLENO
-        elif 'especialista' in text_lower:
-            return cls.ESPECIALISTA
-        
-        return cls.UNKNOWN
+        return best or cls.UNKNOWN
+
+
+# Posição numérica de cada nível, usada na comparação de MatchScore
+ProfessionalLevel.UNKNOWN._rank = 0
+ProfessionalLevel.JUNIOR._rank = 1
+ProfessionalLevel.PLENO._rank = 2
+ProfessionalLevel.SENIOR._rank = 3
+ProfessionalLevel.ESPECIALISTA._rank = 4
 
 
-@dataclass(frozen=True)
+# Categorias de TechnicalSkillSet em ordem de prioridade: vence a primeira com alguma
+# palavra contida na habilidade ("django" contém "go", então é linguagem)
+_SKILL_CATEGORIES = (
+    ("Linguagem de Programação",
+     ('python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'php', 'ruby')),
+    ("Framework",
+     ('react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring', 'express')),
+    ("Banco de Dados",
+     ('postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite')),
+    ("DevOps",
+     ('docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform', 'jenkins')),
+)
+
+
+@lru_cache(maxsize=4096)
+def _categorize_skill_lower(skill_lower: str) -> str:
+    """Implementação memoizada de TechnicalSkillSet._categorize_skill"""
+    for category, words in _SKILL_CATEGORIES:
+        if any(word in skill_lower for word in words):
+            return category
+    return "Geral"
+
+
+# Palavra-chave -> nível, e prioridade entre níveis (menor vence)
+_LEVEL_BY_WORD = {
+    **dict.fromkeys(_SENIOR_WORDS, ProfessionalLevel.SENIOR),
+    **dict.fromkeys(_JUNIOR_WORDS, ProfessionalLevel.JUNIOR),
+    'pleno': ProfessionalLevel.PLENO,
+    'especialista': ProfessionalLevel.ESPECIALISTA,
+}
+_LEVEL_PRIORITY = {
+    ProfessionalLevel.SENIOR: 0,
+    ProfessionalLevel.JUNIOR: 1,
+    ProfessionalLevel.PLENO: 2,
+    ProfessionalLevel.ESPECIALISTA: 3,
+}
+_LEVEL_RE = re.compile('|'.join(re.escape(word) for word in sorted(_LEVEL_BY_WORD, key=len, reverse=True)))
+
+
+@dataclass(frozen=True, slots=True)
 class TechnicalSkill:
     """Habilidade técnica"""
     name: str
     category: str = "Geral"
+    _name_lower: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.name or not self.name.strip():
             raise ValueError("Nome da habilidade não pode ser vazio")
+        object.__setattr__(self, '_name_lower', sys.intern(self.name.lower()))
     
     def matches(self, other_skill: str) -> bool:
         """Verifica se corresponde a outra habilidade"""
-        return self.name.lower() == other_skill.lower()
+        return self._name_lower == other_skill.lower()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TechnicalSkillSet:
     """Conjunto de habilidades técnicas"""
-    skills: Set[TechnicalSkill]
+    # Igualdade e hash pelo conjunto de nomes (a categoria deriva do nome),
+    # independente da ordem em que as habilidades foram encontradas
+    _name_set: FrozenSet[str] = field(repr=False)
+    # Armazenamento em colunas paralelas: nome e categoria de cada habilidade
+    _names: Tuple[str, ...] = field(compare=False)
+    _categories: Tuple[str, ...] = field(compare=False)
+    _by_category: Dict[str, Tuple[int, ...]] = field(compare=False, repr=False)
+    _lower_names: FrozenSet[str] = field(compare=False, repr=False)
     
     def __init__(self, skills: List[str]):
-        # Converter strings em TechnicalSkill
-        skill_objects = set()
+        names = []
+        categories = []
+        seen = set()
+        by_category: Dict[str, List[int]] = {}
         for skill in skills:
-            if skill and skill.strip():
-                category = self._categorize_skill(skill)
-                skill_objects.add(TechnicalSkill(skill.strip(), category))
+            if not skill or not skill.strip():
+                continue
+            name = skill.strip()
+            if name in seen:
+                continue
+            seen.add(name)
+            category = self._categorize_skill(name)
+            by_category.setdefault(category, []).append(len(names))
+            names.append(name)
+            categories.append(category)
         
-        object.__setattr__(self, 'skills', frozenset(skill_objects))
+        object.__setattr__(self, '_name_set', frozenset(names))
+        object.__setattr__(self, '_names', tuple(names))
+        object.__setattr__(self, '_categories', tuple(categories))
+        object.__setattr__(self, '_by_category', {c: tuple(i) for c, i in by_category.items()})
+        object.__setattr__(self, '_lower_names', frozenset(name.lower() for name in names))
+    
+    @property
+    def skills(self) -> FrozenSet[TechnicalSkill]:
+        """Habilidades como objetos TechnicalSkill"""
+        return frozenset(map(TechnicalSkill, self._names, self._categories))
     
     def _categorize_skill(self, skill: str) -> str:
         """Categoriza uma habilidade"""
-        skill_lower = skill.lower()
-        
-        languages = ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'php', 'ruby']
-        frameworks = ['react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring', 'express']
-        databases = ['postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite']
-        devops = ['docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform', 'jenkins']
-        
-        if any(lang in skill_lower for lang in languages):
-            return "Linguagem de Programação"
-        elif any(fw in skill_lower for fw in frameworks):
-            return "Framework"
-        elif any(db in skill_lower for db in databases):
-            return "Banco de Dados"
-        elif any(devops_tool in skill_lower for devops_tool in devops):
-            return "DevOps"
-        else:
-            return "Geral"
+        return _categorize_skill_lower(skill.lower())
     
     def has_skill(self, skill_name: str) -> bool:
         """Verifica se possui uma habilidade"""
-        return any(skill.matches(skill_name) for skill in self.skills)
+        return skill_name.lower() in self._lower_names
     
     def get_skills_by_category(self, category: str) -> List[TechnicalSkill]:
         """Retorna habilidades de uma categoria"""
-        return [skill for skill in self.skills if skill.category == category]
+        return [TechnicalSkill(self._names[i], category) for i in self._by_category.get(category, ())]
     
     def count(self) -> int:
         """Retorna o número de habilidades"""
-        return len(self.skills)
+        return len(self._names)
     
     def to_list(self) -> List[str]:
         """Converte para lista de strings"""
-        return [skill.name for skill in self.skills]
+        return list(self._names)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExperienceYears:
     """Anos de experiência"""
     years: int
@@ -164,21 +251,15 @@ class ExperienceYears:
     @classmethod
     def from_text(cls, text: str) -> 'ExperienceYears':
         """Extrai anos de experiência de texto"""
-        import re
-        
         if not text:
             return cls(0)
-        
-        # Padrões para encontrar anos
-        patterns = [
-            r'(\d+)\s*anos?\s*de\s*experiência',
-            r'experiência\s*de\s*(\d+)\s*anos?',
-            r'(\d+)\s*years?\s*of\s*experience',
-            r'(\d+)\+\s*anos?',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
+        return cls.from_lower_text(text.lower())
+    
+    @classmethod
+    def from_lower_text(cls, text_lower: str) -> 'ExperienceYears':
+        """Extrai anos de experiência de texto já em minúsculas"""
+        for pattern in _EXPERIENCE_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 return cls(int(match.group(1)))
         
@@ -186,20 +267,24 @@ class ExperienceYears:
     
     def get_level_suggestion(self) -> ProfessionalLevel:
         """Sugere nível baseado nos anos"""
-        if self.years >= 5:
-            return ProfessionalLevel.SENIOR
-        elif self.years >= 2:
-            return ProfessionalLevel.PLENO
-        elif self.years > 0:
-            return ProfessionalLevel.JUNIOR
-        else:
-            return ProfessionalLevel.UNKNOWN
+        return _LEVEL_BY_YEARS[min(self.years, _MAX_TABULATED_YEARS)]
     
     def __str__(self) -> str:
         return f"{self.years} anos"
 
 
-@dataclass(frozen=True)
+# Nível sugerido por anos de experiência; acima do limite o nível não muda
+_MAX_TABULATED_YEARS = 60
+_LEVEL_BY_YEARS = tuple(
+    ProfessionalLevel.UNKNOWN if years == 0 else
+    ProfessionalLevel.JUNIOR if years < 2 else
+    ProfessionalLevel.PLENO if years < 5 else
+    ProfessionalLevel.SENIOR
+    for years in range(_MAX_TABULATED_YEARS + 1)
+)
+
+
+@dataclass(frozen=True, slots=True)
 class MatchScore:
     """Score de match entre currículo e requisitos"""
     value: float
@@ -223,7 +308,8 @@ class MatchScore:
         
         # Score por habilidades (50%)
         if required_skills:
-            matched_skills = sum(1 for skill in required_skills if candidate_skills.has_skill(skill))
+            candidate_names = candidate_skills._lower_names
+            matched_skills = sum(1 for skill in required_skills if skill.lower() in candidate_names)
             skills_score = matched_skills / len(required_skills)
             score += skills_score * 0.5
         
@@ -237,15 +323,8 @@ class MatchScore:
         
         # Score por nível (20%)
         if required_level != ProfessionalLevel.UNKNOWN:
-            level_scores = {
-                ProfessionalLevel.JUNIOR: 1,
-                ProfessionalLevel.PLENO: 2,
-                ProfessionalLevel.SENIOR: 3,
-                ProfessionalLevel.ESPECIALISTA: 4
-            }
-            
-            req_score = level_scores.get(required_level, 0)
-            cand_score = level_scores.get(candidate_level, 0)
+            req_score = required_level._rank
+            cand_score = candidate_level._rank
             
             if cand_score >= req_score:
                 score += 0.2
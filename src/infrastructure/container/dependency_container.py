@@ -1,11 +1,14 @@
 import os
+import asyncio
 import logging
-from typing import Optional
+from functools import partial
+from typing import Callable, Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from ..ocr.tesseract_extractor import TesseractTextExtractor
 from ..llm.transformers_service import TransformersIntelligenceService
 from ..persistence.mongodb_repository import DatabaseConnection, MongoDBCurriculumRepository
+from ..persistence.audit_writer import QueuedAuditWriter
 from ...application.interfaces.repositories import ICurriculumRepository
 from ...application.interfaces.services import ITextExtractionService, IIntelligenceService
 from ...application.use_cases.analyze_curriculums import AnalyzeCurriculumsUseCase
@@ -14,35 +17,79 @@ from ...application.use_cases.audit_operations import CreateAuditUseCase, GetAud
 logger = logging.getLogger(__name__)
 
 
+# Dependências síncronas expostas por get_<nome>, guardadas em _<nome>
+_GETTERS = (
+    "repository",
+    "text_extraction_service",
+    "audit_create_use_case",
+    "audit_history_use_case",
+)
+
+
 class DependencyContainer:
     def __init__(self):
         self._database_connection: Optional[DatabaseConnection] = None
         self._database: Optional[AsyncIOMotorDatabase] = None
         self._repository: Optional[ICurriculumRepository] = None
+        self._audit_writer: Optional[QueuedAuditWriter] = None
         self._text_extraction_service: Optional[ITextExtractionService] = None
         self._intelligence_service: Optional[IIntelligenceService] = None
+        self._intelligence_factory: Optional[Callable[[], IIntelligenceService]] = None
+        self._lazy_lock = asyncio.Lock()
         self._analyze_use_case: Optional[AnalyzeCurriculumsUseCase] = None
         self._audit_create_use_case: Optional[CreateAuditUseCase] = None
         self._audit_history_use_case: Optional[GetAuditHistoryUseCase] = None
+        # Último resultado do /health, reaproveitado por health_cache_ttl segundos
+        self.health_cache_ttl = float(os.getenv("HEALTH_CACHE_TTL", "2.0"))
+        self.health_cache = {"value": None, "expires_at": 0.0}
     
     async def initialize(self) -> None:
         logger.info("Inicializando container...")
         await self._setup_database()
         self._setup_services()
         self._setup_use_cases()
+        self._bind_getters()
         logger.info("Container inicializado")
     
     async def _setup_database(self) -> None:
         mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
         database_name = os.getenv("DATABASE_NAME", "curriculum_analyzer")
-        self._database_connection = DatabaseConnection(mongodb_url, database_name)
+        self._database_connection = DatabaseConnection(
+            mongodb_url,
+            database_name,
+            max_pool_size=int(os.getenv("MONGODB_MAX_POOL_SIZE", "50")),
+            min_pool_size=int(os.getenv("MONGODB_MIN_POOL_SIZE", "5")),
+            server_selection_timeout_ms=int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "2000")),
+            max_idle_time_ms=int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "300000")),
+            wait_queue_timeout_ms=int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "2000")),
+            insert_batch_size=int(os.getenv("MONGODB_INSERT_BATCH_SIZE", "500")),
+            insert_max_latency_ms=float(os.getenv("MONGODB_INSERT_MAX_LATENCY_MS", "5"))
+        )
         self._database = await self._database_connection.connect()
         self._repository = self._database_connection.get_repository()
+        self._audit_writer = QueuedAuditWriter(self._repository)
+        self._audit_writer.start()
     
     def _setup_services(self) -> None:
-        self._text_extraction_service = TesseractTextExtractor()
+        ocr_workers = os.getenv("OCR_WORKERS")
+        ocr_engine = os.getenv("OCR_ENGINE", "tesseract").lower()
+        if ocr_engine == "rapidocr":
+            # Dependência opcional (extra "rapidocr"), importada só quando selecionada
+            from ..ocr.rapidocr_extractor import RapidOCRTextExtractor
+            extractor_class = RapidOCRTextExtractor
+        elif ocr_engine == "tesseract":
+            extractor_class = TesseractTextExtractor
+        else:
+            raise ValueError(f"Motor de OCR desconhecido: {ocr_engine}")
+        
+        self._text_extraction_service = extractor_class(
+            pdf_backend=os.getenv("PDF_BACKEND"),
+            ocr_workers=int(ocr_workers) if ocr_workers else None,
+            tesseract_config=os.getenv("TESSERACT_CONFIG")
+        )
         model_name = os.getenv("LLM_MODEL_NAME")
-        self._intelligence_service = TransformersIntelligenceService(model_name)
+        # O modelo só é carregado no primeiro uso (ver get_intelligence_service)
+        self._intelligence_factory = partial(TransformersIntelligenceService, model_name)
     
     def _setup_use_cases(self) -> None:
         """Configura use cases da aplicação"""
@@ -52,22 +99,24 @@ class DependencyContainer:
         if not self._text_extraction_service:
             raise RuntimeError("Text extraction service não foi inicializado")
         
-        if not self._intelligence_service:
-            raise RuntimeError("Intelligence service não foi inicializado")
-        
-        # Use case principal
-        self._analyze_use_case = AnalyzeCurriculumsUseCase(
-            text_extraction_service=self._text_extraction_service,
-            intelligence_service=self._intelligence_service,
-            audit_repository=self._repository  # Temporariamente usando o mesmo repositório
-        )
-        
         # Use cases de auditoria
-        self._audit_create_use_case = CreateAuditUseCase(self._repository)
+        self._audit_create_use_case = CreateAuditUseCase(self._audit_writer)
         self._audit_history_use_case = GetAuditHistoryUseCase(self._repository)
     
+    def _bind_getters(self) -> None:
+        """
+        Troca os getters por funções que apenas devolvem a dependência já criada,
+        removendo a verificação de inicialização do caminho de cada requisição
+        """
+        for name in _GETTERS:
+            dependency = getattr(self, f"_{name}")
+            setattr(self, f"get_{name}", lambda dependency=dependency: dependency)
+    
     async def cleanup(self) -> None:
         """Limpa recursos"""
+        if self._audit_writer:
+            await self._audit_writer.stop()
+        
         if self._database_connection:
             await self._database_connection.disconnect()
         
@@ -87,16 +136,35 @@ class DependencyContainer:
             raise RuntimeError("Text extraction service não foi inicializado")
         return self._text_extraction_service
     
-    def get_intelligence_service(self) -> IIntelligenceService:
-        """Retorna serviço de inteligência"""
-        if not self._intelligence_service:
-            raise RuntimeError("Intelligence service não foi inicializado")
+    def is_intelligence_service_loaded(self) -> bool:
+        """Indica se o serviço de inteligência já foi carregado"""
+        return self._intelligence_service is not None
+    
+    async def get_intelligence_service(self) -> IIntelligenceService:
+        """Retorna serviço de inteligência, carregando-o no primeiro uso"""
+        if self._intelligence_service is None:
+            if not self._intelligence_factory:
+                raise RuntimeError("Intelligence service não foi inicializado")
+            async with self._lazy_lock:
+                if self._intelligence_service is None:
+                    # Carregamento pesado fora do event loop
+                    self._intelligence_service = await asyncio.to_thread(self._intelligence_factory)
         return self._intelligence_service
     
-    def get_analyze_use_case(self) -> AnalyzeCurriculumsUseCase:
-        """Retorna use case de análise"""
-        if not self._analyze_use_case:
-            raise RuntimeError("Analyze use case não foi inicializado")
+    async def get_analyze_use_case(self) -> AnalyzeCurriculumsUseCase:
+        """Retorna use case de análise, criado junto com o serviço de inteligência"""
+        if self._analyze_use_case is None:
+            if not self._repository or not self._text_extraction_service:
+                raise RuntimeError("Analyze use case não foi inicializado")
+            intelligence_service = await self.get_intelligence_service()
+            if self._analyze_use_case is None:
+                self._analyze_use_case = AnalyzeCurriculumsUseCase(
+                    text_extraction_service=self._text_extraction_service,
+                    intelligence_service=intelligence_service,
+                    audit_repository=self._repository,  # Temporariamente usando o mesmo repositório
+                    audit_writer=self._audit_writer,
+                    max_concurrency=int(os.getenv("ANALYZE_CONCURRENCY", "8"))
+                )
         return self._analyze_use_case
     
     def get_audit_create_use_case(self) -> CreateAuditUseCase:
@@ -114,6 +182,7 @@ class DependencyContainer:
 
 # Instância global do container
 _container: Optional[DependencyContainer] = None
+_container_lock = asyncio.Lock()
 
 
 async def get_container() -> DependencyContainer:
@@ -125,9 +194,15 @@ async def get_container() -> DependencyContainer:
     """
     global _container
     
-    if _container is None:
-        _container = DependencyContainer()
-        await _container.initialize()
+    if _container is not None:
+        return _container
+    
+    # Chamadas concorrentes durante o startup aguardam uma única inicialização
+    async with _container_lock:
+        if _container is None:
+            container = DependencyContainer()
+            await container.initialize()
+            _container = container
     
     return _container
 
@@ -136,6 +211,7 @@ async def cleanup_container() -> None:
     """Limpa o container global"""
     global _container
     
-    if _container:
-        await _container.cleanup()
-        _container = None
\ No newline at end of file
+    async with _container_lock:
+        if _container:
+            await _container.cleanup()
+            _container = None
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Palavras-chave usadas pelo serviço de inteligência para classificar currículos
+"""
+
+# Habilidades técnicas para detecção (a ordem é a ordem de saída)
+TECHNICAL_SKILLS = (
+    # Linguagens de Programação
+    "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
+    "php", "ruby", "swift", "kotlin", "scala", "r", "matlab", "sql",
+
+    # Frameworks Web
+    "react", "angular", "vue", "django", "flask", "fastapi", "spring",
+    "express", "nodejs", "laravel", "rails", "next.js", "nuxt",
+
+    # Bancos de Dados
+    "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
+    "sqlite", "oracle", "sql server", "cassandra", "dynamodb",
+
+    # DevOps e Cloud
+    "docker", "kubernetes", "aws", "azure", "gcp", "terraform",
+    "jenkins", "gitlab ci", "github actions", "ansible", "chef",
+
+    # Outras tecnologias
+    "git", "linux", "nginx", "apache", "microservices", "api rest",
+    "graphql", "machine learning", "data science", "big data",
+    "pandas", "numpy", "tensorflow", "pytorch",
+)
+
+# Palavras-chave de formação acadêmica
+EDUCATION_KEYWORDS = (
+    "bacharelado", "bacharel", "graduação", "graduado",
+    "mestrado", "mestre", "doutorado", "doutor", "phd",
+    "técnico", "tecnólogo", "superior", "universidade",
+    "faculdade", "instituto", "engenharia", "ciência da computação",
+    "sistemas de informação", "análise de sistemas",
+)
+
+# Áreas de atuação em ordem de prioridade e suas palavras-chave
+WORK_AREAS = {
+    "Desenvolvimento de Software": ("desenvolvedor", "programador", "software", "frontend", "backend"),
+    "Ciência de Dados": ("dados", "data", "analytics", "scientist", "analyst"),
+    "DevOps/Infraestrutura": ("devops", "infraestrutura", "cloud", "sysadmin", "sre"),
+    "Mobile": ("mobile", "android", "ios", "app", "aplicativo"),
+    "UI/UX": ("designer", "ui", "ux", "design", "interface"),
+}
@@ -3,9 +3,14 @@ Implementação do serviço de inteligência usando Transformers
 """
 
 import re
-from typing import List, Dict, Any, Optional
+import heapq
+import threading
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import logging
 
+import ahocorasick
+from cachetools import LRUCache
+
 from ...application.interfaces.services import IIntelligenceService
 from ...domain.entities.curriculum import CurriculumDocument, CurriculumAnalysis
 from ...domain.value_objects.curriculum_values import (
@@ -14,10 +19,102 @@ from ...domain.value_objects.curriculum_values import (
     ProfessionalLevel, 
     MatchScore
 )
+from .patterns import TECHNICAL_SKILLS, EDUCATION_KEYWORDS, WORK_AREAS
+
+try:
+    # RE2 garante tempo linear nas alternações grandes; opcional (extra "fast")
+    import re2 as _regex
+except ImportError:
+    _regex = re
 
 logger = logging.getLogger(__name__)
 
 
+def _is_word_char(char: str) -> bool:
+    """Equivalente a \\w das expressões regulares"""
+    return char.isalnum() or char == "_"
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Verifica se text[start:end] não está colado a outros caracteres de palavra"""
+    return ((start == 0 or not _is_word_char(text[start - 1])) and
+            (end == len(text) or not _is_word_char(text[end])))
+
+
+# Primeiro número de um texto como "8 anos"
+_FIRST_NUMBER_RE = re.compile(r'(\d+)')
+
+
+# Linhas que não podem ser um nome: contêm dígitos ou termos de cabeçalho/contato
+_NAME_BLOCK_RE = re.compile(r'\d|cv|curriculum|resumo|email|@', re.IGNORECASE)
+
+
+def _compile_alternation(words: Sequence[str]) -> Any:
+    """
+    Compila uma única expressão que encontra qualquer uma das palavras inteiras
+    
+    Args:
+        words: Palavras em minúsculas
+        
+    Returns:
+        Expressão compilada (RE2 quando disponível); as palavras mais longas são tentadas primeiro
+    """
+    branches = []
+    for word in sorted(words, key=len, reverse=True):
+        # \b só delimita palavras que terminam em caractere de palavra (não c++, c#)
+        suffix = r'\b' if _is_word_char(word[-1]) else ''
+        branches.append(r'\b' + re.escape(word) + suffix)
+    return _regex.compile('|'.join(branches))
+
+
+# Categorias das palavras do autômato de palavras-chave
+_SKILL, _EDUCATION, _AREA = range(3)
+
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """
+    Autômato Aho-Corasick único com habilidades, formações e palavras-chave de área,
+    para classificar o texto inteiro em uma só varredura
+    
+    Returns:
+        Autômato cujo valor de cada palavra é (tamanho, marcações); cada marcação é
+        (_SKILL, índice da habilidade), (_EDUCATION, índice da formação) ou (_AREA, prioridade da área)
+    """
+    tags: Dict[str, list] = {}
+    for index, skill in enumerate(TECHNICAL_SKILLS):
+        tags.setdefault(skill, []).append((_SKILL, index))
+    for index, keyword in enumerate(EDUCATION_KEYWORDS):
+        tags.setdefault(keyword, []).append((_EDUCATION, index))
+    for rank, keywords in enumerate(WORK_AREAS.values()):
+        for keyword in keywords:
+            tags.setdefault(keyword, []).append((_AREA, rank))
+    
+    automaton = ahocorasick.Automaton()
+    for word, word_tags in tags.items():
+        automaton.add_word(word, (len(word), tuple(word_tags)))
+    automaton.make_automaton()
+    return automaton
+
+
+# Construídos uma única vez, na importação do módulo; só são lidos depois disso
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+_AREA_NAMES = tuple(WORK_AREAS)
+_SKILLS_RE = _compile_alternation(TECHNICAL_SKILLS)
+
+# Requisitos de nível e experiência em queries ("python sênior 5+ anos")
+_QUERY_LEVEL_RE = re.compile(r'senior|sênior|junior|júnior|pleno')
+_QUERY_LEVEL_BY_WORD = {
+    'senior': ProfessionalLevel.SENIOR,
+    'sênior': ProfessionalLevel.SENIOR,
+    'junior': ProfessionalLevel.JUNIOR,
+    'júnior': ProfessionalLevel.JUNIOR,
+    'pleno': ProfessionalLevel.PLENO,
+}
+# Se a query cita vários níveis, vale o primeiro desta lista
+_QUERY_LEVEL_PRIORITY = (ProfessionalLevel.SENIOR, ProfessionalLevel.JUNIOR, ProfessionalLevel.PLENO)
+_QUERY_EXPERIENCE_RE = re.compile(r'(\d+)\+?\s*anos?')
+
+
 class TransformersIntelligenceService(IIntelligenceService):
     """
     Serviço de inteligência usando regras e padrões + Transformers
@@ -32,29 +129,18 @@ class TransformersIntelligenceService(IIntelligenceService):
         """
         self.model_name = model_name
         
-        # Lista de habilidades técnicas para detecção
-        self.technical_skills_patterns = [
-            # Linguagens de Programação
-            "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
-            "php", "ruby", "swift", "kotlin", "scala", "r", "matlab", "sql",
-            
-            # Frameworks Web
-            "react", "angular", "vue", "django", "flask", "fastapi", "spring",
-            "express", "nodejs", "laravel", "rails", "next.js", "nuxt",
-            
-            # Bancos de Dados
-            "postgresql", "mysql", "mongodb", "redis", "elasticsearch", 
-            "sqlite", "oracle", "sql server", "cassandra", "dynamodb",
-            
-            # DevOps e Cloud
-            "docker", "kubernetes", "aws", "azure", "gcp", "terraform",
-            "jenkins", "gitlab ci", "github actions", "ansible", "chef",
-            
-            # Outras tecnologias
-            "git", "linux", "nginx", "apache", "microservices", "api rest",
-            "graphql", "machine learning", "data science", "big data",
-            "pandas", "numpy", "tensorflow", "pytorch"
-        ]
+        # Requisitos já interpretados, por texto da query
+        self._query_cache: LRUCache = LRUCache(maxsize=256)
+        self._cache_lock = threading.Lock()
+        
+        # Palavras-chave e autômatos são compartilhados entre instâncias (ver patterns.py)
+        self.technical_skills_patterns = TECHNICAL_SKILLS
+        self.education_keywords = EDUCATION_KEYWORDS
+        self.work_areas = WORK_AREAS
+        self._keyword_automaton = _KEYWORD_AUTOMATON
+        self._skills_re = _SKILLS_RE
+        self._level_re = _QUERY_LEVEL_RE
+        self._exp_re = _QUERY_EXPERIENCE_RE
     
     def analyze_curriculum(self, document: CurriculumDocument) -> CurriculumAnalysis:
         """
@@ -66,14 +152,13 @@ class TransformersIntelligenceService(IIntelligenceService):
         Returns:
             Análise estruturada do currículo
         """
+        # Repetições do mesmo texto já são respondidas pelo cache por hash do caso de uso
         text = document.extracted_text
+        text_lower = text.lower()
         
-        # Extrair informações
-        skills = self.extract_skills(text)
-        experience = self.extract_experience(text)
-        level = self.determine_level(text, skills, experience)
-        summary = self.generate_summary(text, document.file_name)
-        education = self._extract_education(text)
+        # Extrair informações uma única vez e reaproveitá-las no resumo
+        skills, experience, level, education, area = self._get_profile(text, text_lower)
+        summary = self._build_summary(text, document.file_name, skills, experience, level, education, area)
         
         # Criar análise
         analysis = CurriculumAnalysis(
@@ -100,17 +185,53 @@ class TransformersIntelligenceService(IIntelligenceService):
         if not text:
             return TechnicalSkillSet([])
         
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in self.technical_skills_patterns:
-            if skill in text_lower:
-                # Verificar se não é parte de outra palavra
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.append(skill.title())
+        skills, _, _ = self._scan_keywords(text.lower())
+        return skills
+    
+    def _scan_keywords(self, text_lower: str) -> Tuple[TechnicalSkillSet, Optional[str], Optional[str]]:
+        """
+        Encontra habilidades, formação e área em uma única varredura do texto
         
-        return TechnicalSkillSet(found_skills)
+        Args:
+            text_lower: Texto do currículo em minúsculas
+            
+        Returns:
+            Tupla (habilidades, formação, área)
+        """
+        skill_indexes = set()
+        education_indexes = set()
+        area_rank = None
+        
+        for end, (length, tags) in self._keyword_automaton.iter(text_lower):
+            start = end - length + 1
+            whole_word = None
+            for category, value in tags:
+                if category == _AREA:
+                    # Áreas aceitam a palavra-chave em qualquer posição
+                    if area_rank is None or value < area_rank:
+                        area_rank = value
+                    continue
+                if category == _EDUCATION:
+                    # Formações também ("superiores" conta como "superior")
+                    education_indexes.add(value)
+                    continue
+                
+                # Habilidades não podem ser parte de outra palavra
+                if whole_word is None:
+                    whole_word = _is_whole_word(text_lower, start, end + 1)
+                if whole_word:
+                    skill_indexes.add(value)
+        
+        # Habilidades na ordem da lista de habilidades
+        skills = TechnicalSkillSet([self.technical_skills_patterns[i].title() for i in sorted(skill_indexes)])
+        
+        # Até 3 formações, na ordem da lista de palavras-chave
+        education = ", ".join(
+            self.education_keywords[i].title() for i in sorted(education_indexes)[:3]
+        ) or None
+        
+        area = _AREA_NAMES[area_rank] if area_rank is not None else None
+        return skills, education, area
     
     def extract_experience(self, text: str) -> ExperienceYears:
         """
@@ -124,7 +245,13 @@ class TransformersIntelligenceService(IIntelligenceService):
         """
         return ExperienceYears.from_text(text)
     
-    def determine_level(self, text: str, skills: TechnicalSkillSet, experience: ExperienceYears) -> ProfessionalLevel:
+    def determine_level(
+        self,
+        text: str,
+        skills: TechnicalSkillSet,
+        experience: ExperienceYears,
+        text_is_lower: bool = False
+    ) -> ProfessionalLevel:
         """
         Determina o nível profissional
         
@@ -132,12 +259,16 @@ class TransformersIntelligenceService(IIntelligenceService):
             text: Texto do currículo
             skills: Habilidades identificadas
             experience: Anos de experiência
+            text_is_lower: Se o texto já está em minúsculas
             
         Returns:
             Nível profissional determinado
         """
         # Primeiro, tentar identificar por palavras-chave no texto
-        level_from_text = ProfessionalLevel.from_text(text)
+        if text_is_lower:
+            level_from_text = ProfessionalLevel.from_lower_text(text)
+        else:
+            level_from_text = ProfessionalLevel.from_text(text)
         if level_from_text != ProfessionalLevel.UNKNOWN:
             return level_from_text
         
@@ -172,10 +303,36 @@ class TransformersIntelligenceService(IIntelligenceService):
             return f"Não foi possível extrair texto significativo de {file_name}"
         
         # Extrair informações para o resumo
-        skills = self.extract_skills(text)
-        experience = self.extract_experience(text)
-        level = self.determine_level(text, skills, experience)
-        education = self._extract_education(text)
+        skills, experience, level, education, area = self._get_profile(text, text.lower())
+        return self._build_summary(text, file_name, skills, experience, level, education, area)
+    
+    def _build_summary(
+        self,
+        text: str,
+        file_name: str,
+        skills: TechnicalSkillSet,
+        experience: ExperienceYears,
+        level: ProfessionalLevel,
+        education: Optional[str],
+        area: Optional[str]
+    ) -> str:
+        """
+        Monta o resumo a partir de informações já extraídas
+        
+        Args:
+            text: Texto extraído
+            file_name: Nome do arquivo
+            skills: Habilidades identificadas
+            experience: Anos de experiência
+            level: Nível profissional
+            education: Formação encontrada
+            area: Área de atuação
+            
+        Returns:
+            Resumo estruturado
+        """
+        if not text.strip():
+            return f"Não foi possível extrair texto significativo de {file_name}"
         
         # Construir resumo
         summary_parts = []
@@ -208,40 +365,49 @@ class TransformersIntelligenceService(IIntelligenceService):
         if education:
             summary_parts.append(f"Formação: {education}")
         
-        # Identificar área de atuação
-        area = self._identify_work_area(text)
+        # Adicionar área de atuação
         if area:
             summary_parts.append(f"Área: {area}")
         
         return ". ".join(summary_parts) + "."
     
-    def analyze_query_match(self, analyses: List[CurriculumAnalysis], query: str) -> dict:
+    def analyze_query_match(self, analyses: List[CurriculumAnalysis], query: str, top_k: Optional[int] = None) -> dict:
         """
         Analisa match com query específica
         
         Args:
             analyses: Lista de análises de currículos
             query: Query para matching
+            top_k: Quantidade máxima de candidatos no ranking (todos se None)
             
         Returns:
             Resultado da análise de matching
         """
         query_requirements = self._parse_query_requirements(query)
         
-        matches = []
+        scored = []
         for analysis in analyses:
-            score = self._calculate_match_score(analysis, query_requirements)
-            reasons = self._generate_match_reasons(analysis, query_requirements)
-            
-            matches.append({
+            # Habilidades em comum calculadas uma vez para o score e as razões
+            matched_skills = self._match_skills(analysis, query_requirements)
+            score = self._calculate_match_score(analysis, query_requirements, matched_skills)
+            scored.append((float(score), analysis, matched_skills))
+        
+        # Ordenar por score; com top_k só os melhores são selecionados (O(n log k))
+        if top_k is not None and top_k < len(scored):
+            ranked = heapq.nlargest(top_k, scored, key=lambda item: item[0])
+        else:
+            ranked = sorted(scored, key=lambda item: item[0], reverse=True)
+        
+        # Razões só para os candidatos retornados
+        matches = [
+            {
                 "document_id": analysis.document_id,
-                "score": float(score),
-                "match_reasons": reasons,
+                "score": score,
+                "match_reasons": self._generate_match_reasons(analysis, query_requirements, matched_skills),
                 "summary": analysis.summary
-            })
-        
-        # Ordenar por score
-        matches.sort(key=lambda x: x["score"], reverse=True)
+            }
+            for score, analysis, matched_skills in ranked
+        ]
         
         # Gerar reasoning
         reasoning = self._generate_analysis_reasoning(matches, query)
@@ -252,27 +418,26 @@ class TransformersIntelligenceService(IIntelligenceService):
             "analysis_reasoning": reasoning
         }
     
-    def _extract_education(self, text: str) -> Optional[str]:
-        """Extrai informações de educação"""
-        education_keywords = [
-            "bacharelado", "bacharel", "graduação", "graduado",
-            "mestrado", "mestre", "doutorado", "doutor", "phd",
-            "técnico", "tecnólogo", "superior", "universidade",
-            "faculdade", "instituto", "engenharia", "ciência da computação",
-            "sistemas de informação", "análise de sistemas"
-        ]
-        
-        text_lower = text.lower()
-        found_education = []
-        
-        for keyword in education_keywords:
-            if keyword in text_lower:
-                found_education.append(keyword.title())
-        
-        if found_education:
-            return ", ".join(list(set(found_education))[:3])
+    def _get_profile(
+        self,
+        text: str,
+        text_lower: str
+    ) -> Tuple[TechnicalSkillSet, ExperienceYears, ProfessionalLevel, Optional[str], Optional[str]]:
+        """
+        Retorna habilidades, experiência, nível, formação e área do currículo
         
-        return None
+        Args:
+            text: Texto do currículo
+            text_lower: Mesmo texto em minúsculas
+            
+        Returns:
+            Tupla (habilidades, experiência, nível, formação, área)
+        """
+        skills, education, area = self._scan_keywords(text_lower)
+        # O texto é convertido para minúsculas uma única vez, pelo chamador
+        experience = ExperienceYears.from_lower_text(text_lower)
+        level = self.determine_level(text_lower, skills, experience, text_is_lower=True)
+        return skills, experience, level, education, area
     
     def _extract_candidate_name(self, text: str) -> Optional[str]:
         """Tenta extrair o nome do candidato das primeiras linhas"""
@@ -282,32 +447,23 @@ class TransformersIntelligenceService(IIntelligenceService):
             # Nome provável: linha com 2-4 palavras, sem números, não muito longa
             if (2 <= len(line.split()) <= 4 and 
                 len(line) < 50 and 
-                not any(char.isdigit() for char in line) and
-                not any(word in line.lower() for word in ['cv', 'curriculum', 'resumo', 'email', '@'])):
+                not _NAME_BLOCK_RE.search(line)):
                 return line
         
         return None
     
-    def _identify_work_area(self, text: str) -> Optional[str]:
-        """Identifica área de atuação principal"""
-        text_lower = text.lower()
-        
-        areas = {
-            "Desenvolvimento de Software": ["desenvolvedor", "programador", "software", "frontend", "backend"],
-            "Ciência de Dados": ["dados", "data", "analytics", "scientist", "analyst"],
-            "DevOps/Infraestrutura": ["devops", "infraestrutura", "cloud", "sysadmin", "sre"],
-            "Mobile": ["mobile", "android", "ios", "app", "aplicativo"],
-            "UI/UX": ["designer", "ui", "ux", "design", "interface"]
-        }
-        
-        for area, keywords in areas.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return area
-        
-        return None
-    
     def _parse_query_requirements(self, query: str) -> dict:
-        """Parse dos requisitos da query"""
+        """Parse dos requisitos da query, memoizado pelo texto (o resultado não deve ser alterado)"""
+        with self._cache_lock:
+            requirements = self._query_cache.get(query)
+        if requirements is None:
+            requirements = self._build_query_requirements(query)
+            with self._cache_lock:
+                self._query_cache[query] = requirements
+        return requirements
+    
+    def _build_query_requirements(self, query: str) -> dict:
+        """Interpreta os requisitos de uma query"""
         requirements = {
             "skills": [],
             "experience_years": 0,
@@ -318,76 +474,85 @@ class TransformersIntelligenceService(IIntelligenceService):
         query_lower = query.lower()
         
         # Extrair habilidades mencionadas
-        for skill in self.technical_skills_patterns:
-            if skill in query_lower:
-                requirements["skills"].append(skill)
+        requirements["skills"] = list(dict.fromkeys(self._skills_re.findall(query_lower)))
         
         # Extrair anos de experiência
-        exp_pattern = r'(\d+)\+?\s*anos?'
-        exp_match = re.search(exp_pattern, query_lower)
+        exp_match = self._exp_re.search(query_lower)
         if exp_match:
             requirements["experience_years"] = int(exp_match.group(1))
         
-        # Extrair nível
-        if any(word in query_lower for word in ['senior', 'sênior']):
-            requirements["level"] = ProfessionalLevel.SENIOR
-        elif any(word in query_lower for word in ['junior', 'júnior']):
-            requirements["level"] = ProfessionalLevel.JUNIOR
-        elif 'pleno' in query_lower:
-            requirements["level"] = ProfessionalLevel.PLENO
+        # Extrair nível em uma única varredura
+        levels = {_QUERY_LEVEL_BY_WORD[word] for word in self._level_re.findall(query_lower)}
+        for level in _QUERY_LEVEL_PRIORITY:
+            if level in levels:
+                requirements["level"] = level
+                break
         
-        # Palavras-chave gerais
+        # Palavras-chave gerais (e em minúsculas, para comparar com os resumos)
         requirements["keywords"] = query.split()
+        requirements["keywords_lower"] = [keyword.lower() for keyword in requirements["keywords"]]
         
         return requirements
     
-    def _calculate_match_score(self, analysis: CurriculumAnalysis, requirements: dict) -> float:
+    def _match_skills(self, analysis: CurriculumAnalysis, requirements: dict) -> List[str]:
+        """Retorna as habilidades pedidas que o currículo possui"""
+        return [skill for skill in requirements["skills"] if analysis.has_skill(skill)]
+    
+    def _calculate_match_score(
+        self,
+        analysis: CurriculumAnalysis,
+        requirements: dict,
+        matched_skills: Optional[List[str]] = None
+    ) -> float:
         """Calcula score de match"""
         score = 0.0
         
         # Score por habilidades (40%)
         if requirements["skills"]:
-            analysis_skills = [skill.lower() for skill in analysis.skills]
-            matched_skills = sum(1 for skill in requirements["skills"] if skill in analysis_skills)
-            skills_score = matched_skills / len(requirements["skills"])
+            if matched_skills is None:
+                matched_skills = self._match_skills(analysis, requirements)
+            skills_score = len(matched_skills) / len(requirements["skills"])
             score += skills_score * 0.4
         
         # Score por experiência (30%)
         if requirements["experience_years"] > 0 and analysis.experience_years:
-            try:
-                analysis_years = int(re.search(r'(\d+)', analysis.experience_years).group(1))
+            years_match = _FIRST_NUMBER_RE.search(analysis.experience_years)
+            if years_match:
+                analysis_years = int(years_match.group(1))
                 if analysis_years >= requirements["experience_years"]:
                     score += 0.3
                 else:
                     ratio = analysis_years / requirements["experience_years"]
                     score += ratio * 0.3
-            except:
-                pass
         
         # Score por nível (20%)
         if (requirements["level"] != ProfessionalLevel.UNKNOWN and 
-            analysis.position_level and
-            ProfessionalLevel(analysis.position_level) == requirements["level"]):
+            analysis.position_level == requirements["level"].value):
             score += 0.2
         
         # Score por palavras-chave no resumo (10%)
-        if requirements["keywords"] and analysis.summary:
+        keywords_lower = requirements["keywords_lower"]
+        if keywords_lower and analysis.summary:
             summary_lower = analysis.summary.lower()
-            keyword_matches = sum(1 for kw in requirements["keywords"] if kw.lower() in summary_lower)
-            if len(requirements["keywords"]) > 0:
-                keyword_score = keyword_matches / len(requirements["keywords"])
-                score += keyword_score * 0.1
+            keyword_matches = sum(1 for keyword in keywords_lower if keyword in summary_lower)
+            keyword_score = keyword_matches / len(keywords_lower)
+            score += keyword_score * 0.1
         
         return min(score, 1.0)
     
-    def _generate_match_reasons(self, analysis: CurriculumAnalysis, requirements: dict) -> List[str]:
+    def _generate_match_reasons(
+        self,
+        analysis: CurriculumAnalysis,
+        requirements: dict,
+        matched_skills: Optional[List[str]] = None
+    ) -> List[str]:
         """Gera razões do match"""
         reasons = []
         
         # Razões por habilidades
         if requirements["skills"]:
-            analysis_skills = [skill.lower() for skill in analysis.skills]
-            matched_skills = [skill for skill in requirements["skills"] if skill in analysis_skills]
+            if matched_skills is None:
+                matched_skills = self._match_skills(analysis, requirements)
             if matched_skills:
                 reasons.append(f"Domínio em: {', '.join(matched_skills)}")
         
@@ -0,0 +1,78 @@
+"""
+Implementação do serviço de extração de texto usando RapidOCR (modelos PP-OCR no ONNX Runtime)
+"""
+
+from typing import Iterable, Optional
+from PIL import Image
+from rapidocr_onnxruntime import RapidOCR
+
+from .tesseract_extractor import TesseractTextExtractor
+
+
+# Idiomas enviados ao RapidOCR; os demais continuam no Tesseract. Os modelos padrão
+# são de chinês/inglês, sem os diacríticos do português
+DEFAULT_RAPIDOCR_LANGS = ("eng",)
+
+
+class RapidOCRTextExtractor(TesseractTextExtractor):
+    """
+    Extração de texto com RapidOCR; PDFs com camada de texto continuam no PDFium
+    e idiomas fora de rapidocr_langs continuam no Tesseract
+    """
+    
+    def __init__(
+        self,
+        tesseract_path: Optional[str] = None,
+        pdf_backend: Optional[str] = None,
+        ocr_workers: Optional[int] = None,
+        tesseract_config: Optional[str] = None,
+        rapidocr_langs: Optional[Iterable[str]] = None
+    ):
+        """
+        Inicializa o extrator de texto
+        
+        Args:
+            tesseract_path: Caminho para o executável do Tesseract (opcional)
+            pdf_backend: Biblioteca de PDF, "pdfium" (padrão) ou "pypdf2"
+            ocr_workers: Máximo de páginas em OCR simultâneo (padrão: 1, o ONNX Runtime
+                já usa todas as CPUs em cada página)
+            tesseract_config: Opções extras do Tesseract (padrão: DEFAULT_TESSERACT_CONFIG)
+            rapidocr_langs: Idiomas tratados pelo RapidOCR (padrão: DEFAULT_RAPIDOCR_LANGS)
+        
+        Raises:
+            ValueError: Se o backend de PDF não é conhecido
+        """
+        super().__init__(
+            tesseract_path=tesseract_path,
+            pdf_backend=pdf_backend,
+            ocr_workers=ocr_workers or 1,
+            tesseract_config=tesseract_config
+        )
+        self.rapidocr_langs = frozenset(DEFAULT_RAPIDOCR_LANGS if rapidocr_langs is None else rapidocr_langs)
+        # A sessão do ONNX Runtime é criada uma vez e compartilhada entre as threads de OCR
+        self._engine = RapidOCR()
+    
+    def _ocr_image(self, image: Image.Image, lang: str = 'por') -> str:
+        """
+        Aplica OCR em uma imagem já carregada
+        
+        Args:
+            image: Imagem
+            lang: Idioma para OCR
+        
+        Returns:
+            Texto extraído
+        """
+        if lang not in self.rapidocr_langs:
+            return super()._ocr_image(image, lang)
+        
+        # A rede de detecção trabalha melhor com a imagem original, sem binarização;
+        # só modos de paleta, CMYK etc. precisam de conversão
+        if image.mode not in ("L", "LA", "RGB", "RGBA"):
+            image = image.convert("RGBA")
+        result, _ = self._engine(image)
+        if not result:
+            return ""
+        
+        # Cada item é [caixa, texto, confiança], em ordem de leitura
+        return "\n".join(line[1] for line in result).strip()
@@ -1,12 +1,15 @@
 """
-Implementação do serviço de extração de texto usando Tesseract e PyPDF2
+Implementação do serviço de extração de texto usando Tesseract e PDFium (PyPDF2 como alternativa)
 """
 
 import os
 import mimetypes
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 from PIL import Image
 import pytesseract
+import pypdfium2
 import PyPDF2
 from io import BytesIO
 
@@ -14,21 +17,120 @@ from ...application.interfaces.services import ITextExtractionService
 from ...domain.value_objects.curriculum_values import FileType
 
 
+# Bibliotecas disponíveis para extrair texto de PDFs
+PDF_BACKENDS = ("pdfium", "pypdf2")
+
+# Escala de renderização de páginas sem texto para OCR (300 DPI)
+_OCR_RENDER_SCALE = 300 / 72
+
+# Maior lado da imagem entregue ao Tesseract; o tempo de OCR cresce com o número de pixels
+_OCR_MAX_SIDE = 2000
+
+# LSTM apenas (sem inicializar o motor legado) e texto tratado como um bloco uniforme
+DEFAULT_TESSERACT_CONFIG = "--oem 1 --psm 6"
+
+
+def _otsu_threshold(histogram: List[int]) -> int:
+    """
+    Calcula o limiar de Otsu a partir do histograma de uma imagem em tons de cinza
+    
+    Args:
+        histogram: Contagem de pixels para cada nível (0-255)
+        
+    Returns:
+        Nível que melhor separa fundo e texto
+    """
+    total = sum(histogram)
+    sum_all = sum(level * count for level, count in enumerate(histogram))
+    
+    sum_background = 0
+    weight_background = 0
+    best_threshold = 0
+    best_variance = 0.0
+    for level, count in enumerate(histogram):
+        weight_background += count
+        if weight_background == 0:
+            continue
+        weight_foreground = total - weight_background
+        if weight_foreground == 0:
+            break
+        
+        sum_background += level * count
+        mean_background = sum_background / weight_background
+        mean_foreground = (sum_all - sum_background) / weight_foreground
+        variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            best_threshold = level
+    
+    return best_threshold
+
+
+def _preprocess_for_ocr(image: Image.Image) -> Image.Image:
+    """
+    Prepara uma imagem para OCR: tons de cinza, redução de tamanho e binarização (Otsu)
+    
+    Args:
+        image: Imagem original
+        
+    Returns:
+        Imagem em tons de cinza binarizada
+    """
+    # Transparência vira fundo branco, senão o texto some sobre fundo preto;
+    # a composição é feita em tons de cinza para não alocar planos de cor
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        gray, alpha = image.convert("LA").split()
+        image = Image.new("L", image.size, 255)
+        image.paste(gray, mask=alpha)
+    elif image.mode != "L":
+        image = image.convert("L")
+    
+    if max(image.size) > _OCR_MAX_SIDE:
+        image.thumbnail((_OCR_MAX_SIDE, _OCR_MAX_SIDE), Image.Resampling.LANCZOS)
+    
+    threshold = _otsu_threshold(image.histogram())
+    return image.point([0] * (threshold + 1) + [255] * (255 - threshold))
+
+
 class TesseractTextExtractor(ITextExtractionService):
     """
-    Implementação de extração de texto usando Tesseract OCR e PyPDF2
+    Implementação de extração de texto usando Tesseract OCR e PDFium
     """
     
-    def __init__(self, tesseract_path: Optional[str] = None):
+    def __init__(
+        self,
+        tesseract_path: Optional[str] = None,
+        pdf_backend: Optional[str] = None,
+        ocr_workers: Optional[int] = None,
+        tesseract_config: Optional[str] = None
+    ):
         """
         Inicializa o extrator de texto
         
         Args:
             tesseract_path: Caminho para o executável do Tesseract (opcional)
+            pdf_backend: Biblioteca de PDF, "pdfium" (padrão) ou "pypdf2"
+            ocr_workers: Máximo de páginas em OCR simultâneo (padrão: número de CPUs)
+            tesseract_config: Opções extras do Tesseract (padrão: DEFAULT_TESSERACT_CONFIG)
+        
+        Raises:
+            ValueError: Se o backend de PDF não é conhecido
         """
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
         
+        self.tesseract_config = DEFAULT_TESSERACT_CONFIG if tesseract_config is None else tesseract_config
+        self.pdf_backend = (pdf_backend or "pdfium").lower()
+        if self.pdf_backend not in PDF_BACKENDS:
+            raise ValueError(f"Backend de PDF desconhecido: {pdf_backend}")
+        
+        # O Tesseract roda em processo próprio, então threads bastam para paralelizar páginas
+        self._ocr_workers = ocr_workers or os.cpu_count() or 1
+        self._ocr_executor = ThreadPoolExecutor(
+            max_workers=self._ocr_workers,
+            thread_name_prefix="ocr"
+        )
+        
         self.supported_image_types = {
             FileType.JPEG, FileType.JPG, FileType.PNG, 
             FileType.BMP, FileType.TIFF, FileType.GIF, FileType.WEBP
@@ -47,12 +149,15 @@ class TesseractTextExtractor(ITextExtractionService):
             Texto extraído do arquivo
             
         Raises:
-            ValueError: Se o tipo não é suportado
+            ValueError: Se o tipo não é suportado ou o conteúdo está vazio
             Exception: Se houver erro na extração
         """
         if not self.is_supported_type(file_type):
             raise ValueError(f"Tipo de arquivo não suportado: {file_type.value}")
         
+        if not content:
+            raise ValueError("Conteúdo do arquivo vazio")
+        
         try:
             if file_type in self.supported_image_types:
                 return self._extract_from_image_bytes(content)
@@ -88,21 +193,111 @@ class TesseractTextExtractor(ITextExtractionService):
             Texto extraído
         """
         try:
-            # Abrir imagem dos bytes
-            image = Image.open(BytesIO(content))
-            
-            # Aplicar OCR
-            text = pytesseract.image_to_string(image, lang=lang)
-            
-            return text.strip()
+            with Image.open(BytesIO(content)) as image:
+                # JPEG pode ser decodificado já em tons de cinza e reduzido
+                image.draft("L", (_OCR_MAX_SIDE, _OCR_MAX_SIDE))
+                # Decodificar agora para liberar o arquivo ao sair do bloco
+                image.load()
+                return self._ocr_image(image, lang)
             
         except Exception as e:
             raise Exception(f"Erro no OCR da imagem: {str(e)}")
     
+    def _ocr_image(self, image: Image.Image, lang: str = 'por') -> str:
+        """
+        Pré-processa e aplica OCR em uma imagem já carregada
+        
+        Args:
+            image: Imagem
+            lang: Idioma para OCR
+            
+        Returns:
+            Texto extraído
+        """
+        image = _preprocess_for_ocr(image)
+        return pytesseract.image_to_string(image, lang=lang, config=self.tesseract_config).strip()
+    
     def _extract_from_pdf_bytes(self, content: bytes) -> str:
         """
         Extrai texto de bytes de PDF
         
+        Args:
+            content: Bytes do PDF
+            
+        Returns:
+            Texto extraído
+        """
+        if self.pdf_backend == "pypdf2":
+            return self._extract_from_pdf_bytes_pypdf2(content)
+        
+        try:
+            # Só o OCR das páginas digitalizadas (sem camada de texto) roda em paralelo.
+            # Cada uma vai para o OCR assim que é renderizada, e a renderização espera
+            # enquanto houver _ocr_workers páginas em OCR: a memória não cresce com o PDF
+            pages = []
+            in_flight = deque()
+            for text, image in self._iter_pdf_pages(content):
+                if image is None:
+                    pages.append(text)
+                    continue
+                if len(in_flight) >= self._ocr_workers:
+                    in_flight.popleft().result()
+                future = self._ocr_executor.submit(self._ocr_image, image)
+                in_flight.append(future)
+                pages.append(future)
+            
+            texts = [page if isinstance(page, str) else page.result() for page in pages]
+            # PDFium separa linhas com \r\n
+            return "\n".join(texts).replace("\r\n", "\n").strip()
+            
+        except Exception as e:
+            raise Exception(f"Erro na extração de PDF: {str(e)}")
+    
+    def _iter_pdf_pages(self, content: bytes) -> Iterator[Tuple[str, Optional[Image.Image]]]:
+        """
+        Percorre as páginas de um PDF com o PDFium, uma por vez
+        
+        O PDFium não é thread-safe: o gerador deve ser consumido por uma única thread.
+        
+        Args:
+            content: Bytes do PDF
+            
+        Yields:
+            Tupla (texto da página, imagem renderizada para OCR se a página não tem texto)
+        """
+        pdf = pypdfium2.PdfDocument(content)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                image = None if text.strip() else self._render_for_ocr(page)
+                page.close()
+                yield text, image
+        finally:
+            pdf.close()
+    
+    @staticmethod
+    def _render_for_ocr(page: pypdfium2.PdfPage) -> Image.Image:
+        """
+        Renderiza uma página sem texto para OCR
+        
+        A página sai em tons de cinza e já limitada a _OCR_MAX_SIDE, em vez de ser
+        renderizada a 300 DPI em cores e reduzida depois.
+        
+        Args:
+            page: Página do PDF
+            
+        Returns:
+            Imagem da página
+        """
+        scale = min(_OCR_RENDER_SCALE, _OCR_MAX_SIDE / max(page.get_size()))
+        return page.render(scale=scale, grayscale=True).to_pil()
+    
+    def _extract_from_pdf_bytes_pypdf2(self, content: bytes) -> str:
+        """
+        Extrai texto de bytes de PDF com PyPDF2 (implementação em Python puro, mais lenta)
+        
         Args:
             content: Bytes do PDF
             
@@ -113,12 +308,8 @@ class TesseractTextExtractor(ITextExtractionService):
             # Ler PDF dos bytes
             pdf_reader = PyPDF2.PdfReader(BytesIO(content))
             
-            text = ""
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
-            
-            return text.strip()
+            parts = [page.extract_text() for page in pdf_reader.pages]
+            return "\n".join(part for part in parts if part).strip()
             
         except Exception as e:
             raise Exception(f"Erro na extração de PDF: {str(e)}")
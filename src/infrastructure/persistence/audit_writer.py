@@ -0,0 +1,126 @@
+"""
+Gravação de auditorias em segundo plano, em lotes, via asyncio.Queue
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from ...domain.entities.curriculum import ProcessingAudit
+from ...application.interfaces.repositories import ICurriculumRepository
+from ...application.interfaces.services import IAuditWriter
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedAuditWriter(IAuditWriter):
+    """
+    Enfileira auditorias e as grava em lote com save_audits
+    
+    Os use cases apenas enfileiram (sem await); uma task em segundo plano
+    agrupa até max_batch_size itens ou max_latency_ms e grava com retry.
+    """
+    
+    def __init__(
+        self,
+        repository: ICurriculumRepository,
+        max_queue_size: int = 10_000,
+        max_batch_size: int = 500,
+        max_latency_ms: int = 100,
+        max_retries: int = 5
+    ):
+        """
+        Inicializa o writer
+        
+        Args:
+            repository: Repositório onde as auditorias são gravadas
+            max_queue_size: Tamanho máximo da fila (descarta as mais antigas ao encher)
+            max_batch_size: Máximo de auditorias por escrita
+            max_latency_ms: Tempo máximo de espera para completar um lote
+            max_retries: Tentativas de gravação antes de descartar um lote
+        """
+        self.repository = repository
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self.max_retries = max_retries
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._pending: List[ProcessingAudit] = []
+    
+    def start(self) -> None:
+        """Inicia a task de gravação em segundo plano"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+    
+    async def stop(self) -> None:
+        """Para a task e grava o que ainda estiver pendente"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        remaining = self._pending
+        self._pending = []
+        while not self.queue.empty():
+            remaining.append(self.queue.get_nowait())
+        
+        if remaining:
+            try:
+                await self.repository.save_audits(remaining)
+            except Exception as e:
+                logger.error(f"Erro ao gravar {len(remaining)} auditorias pendentes: {e}")
+    
+    def enqueue(self, audit: ProcessingAudit) -> None:
+        """
+        Enfileira uma auditoria sem bloquear
+        
+        Args:
+            audit: Registro de auditoria
+        """
+        try:
+            self.queue.put_nowait(audit)
+        except asyncio.QueueFull:
+            # Descartar a mais antiga para não bloquear o request
+            self.queue.get_nowait()
+            self.queue.put_nowait(audit)
+            logger.warning("Fila de auditoria cheia, auditoria mais antiga descartada")
+    
+    async def _drain(self) -> None:
+        """Loop de gravação em lote"""
+        while True:
+            self._pending = await self._next_batch()
+            await self._save_with_retry(self._pending)
+            self._pending = []
+    
+    async def _next_batch(self) -> List[ProcessingAudit]:
+        """Aguarda o primeiro item e junta outros até o limite de tamanho ou tempo"""
+        batch = [await self.queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_latency
+        
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        return batch
+    
+    async def _save_with_retry(self, batch: List[ProcessingAudit]) -> None:
+        """Grava um lote com backoff exponencial"""
+        for attempt in range(self.max_retries):
+            try:
+                await self.repository.save_audits(batch)
+                return
+            except Exception as e:
+                delay = min(2 ** attempt, 30)
+                logger.warning(f"Erro ao gravar auditorias (tentativa {attempt + 1}): {e}; nova tentativa em {delay}s")
+                await asyncio.sleep(delay)
+        
+        logger.error(f"Lote de {len(batch)} auditorias descartado após {self.max_retries} tentativas")
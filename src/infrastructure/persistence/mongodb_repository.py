@@ -2,33 +2,402 @@
 Implementação do repositório usando MongoDB com Motor (async)
 """
 
+import asyncio
 import logging
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
+from cachetools import TTLCache
+import bson
+import pymongo
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
+from pymongo import IndexModel, UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError, OperationFailure, WriteError
 
 from ...domain.entities.curriculum import CurriculumDocument, CurriculumAnalysis, ProcessingAudit
+from ...domain.value_objects.curriculum_values import FileType
 from ...application.interfaces.repositories import ICurriculumRepository
 
 logger = logging.getLogger(__name__)
 
 
+# FileType pelo valor gravado; um dict evita a chamada FileType(valor) por documento lido
+_FILETYPE_CACHE = {file_type.value: file_type for file_type in FileType}
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    """
+    Lê um timestamp gravado como data BSON (ou como texto ISO, em registros antigos
+    ainda não convertidos por migrate_string_timestamps)
+    
+    Args:
+        value: Valor lido do MongoDB
+        
+    Returns:
+        datetime correspondente ou None
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+# Campos de data que registros antigos gravaram como texto ISO, por coleção
+_LEGACY_TIMESTAMP_FIELDS = {
+    "curriculum_documents": ("upload_timestamp", "processing_timestamp", "created_at", "updated_at"),
+    "curriculum_analyses": ("analysis_timestamp", "created_at"),
+    "processing_audits": ("timestamp", "created_at"),
+}
+
+
+# Códigos de erro do MongoDB quando dois workers trocam o mesmo índice ao mesmo tempo:
+# IndexNotFound, IndexOptionsConflict, IndexKeySpecsConflict e IndexBuildAborted
+_INDEX_NOT_FOUND = 27
+_INDEX_RACE_CODES = (_INDEX_NOT_FOUND, 85, 86, 276)
+
+
+# Ordenações das listagens; o id desempata registros com o mesmo timestamp
+_DOCUMENT_ORDER = [("upload_timestamp", -1), ("id", -1)]
+_ANALYSIS_ORDER = [("analysis_timestamp", -1), ("id", -1)]
+_AUDIT_ORDER = [("timestamp", -1), ("id", -1)]
+
+
+# Exclui o texto extraído que registros antigos guardam no próprio documento
+_NO_TEXT_PROJECTION = {"extracted_text": 0}
+
+# Campos de documento exibidos nas listagens (sem o texto extraído)
+_DOCUMENT_INFO_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "file_name": 1,
+    "file_type": 1,
+    "file_size": 1,
+    "processed": 1,
+    "upload_timestamp": 1,
+    "processing_timestamp": 1,
+    "error_message": 1,
+}
+
+
+def _keyset_query(field: str, after: Optional[Tuple[datetime, str]], query: Optional[dict] = None) -> dict:
+    """
+    Filtro da próxima página em ordem (field, id) decrescente
+    
+    Compara com datas BSON: timestamps ainda em texto ficariam fora do intervalo,
+    por isso DatabaseConnection.connect roda migrate_string_timestamps antes.
+    
+    Args:
+        field: Campo de timestamp da ordenação
+        after: (timestamp, id) do último registro da página anterior, ou None para a primeira
+        query: Filtro adicional
+        
+    Returns:
+        Filtro do MongoDB
+    """
+    query = dict(query or {})
+    if after is not None:
+        timestamp, last_id = after
+        query["$or"] = [
+            {field: {"$lt": timestamp}},
+            {field: timestamp, "id": {"$lt": last_id}},
+        ]
+    return query
+
+
+class _BatchQueue:
+    """
+    Agrupa inserções concorrentes em uma coleção em um único insert_many
+    
+    Cada chamada a insert aguarda a gravação do seu lote, então o chamador continua
+    recebendo o erro da sua inserção. Sem a task iniciada, insere diretamente.
+    """
+    
+    def __init__(self, collection: AsyncIOMotorCollection, max_batch_size: int = 500, max_latency_ms: float = 5):
+        """
+        Inicializa a fila
+        
+        Args:
+            collection: Coleção onde os documentos são inseridos
+            max_batch_size: Máximo de documentos por insert_many
+            max_latency_ms: Tempo de espera por outras inserções antes de gravar um lote
+        """
+        self.collection = collection
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self._pending: List[Tuple[dict, asyncio.Future]] = []
+        self._event = asyncio.Event()
+        self._closing = False
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Inicia a task de gravação em segundo plano"""
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Grava o que estiver pendente e encerra a task"""
+        if self._task is not None:
+            self._closing = True
+            self._event.set()
+            await self._task
+            self._task = None
+    
+    async def insert(self, document: dict) -> None:
+        """
+        Insere um documento no próximo lote
+        
+        Args:
+            document: Documento a ser inserido
+        """
+        if self._task is None:
+            await self.collection.insert_one(document)
+            return
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((document, future))
+        self._event.set()
+        await future
+    
+    async def _run(self) -> None:
+        """Loop de gravação em lote"""
+        while True:
+            await self._event.wait()
+            if not self._closing and len(self._pending) < self.max_batch_size:
+                # Dá tempo para outras inserções entrarem no mesmo lote
+                await asyncio.sleep(self.max_latency)
+            await self._flush()
+            if not self._pending:
+                if self._closing:
+                    return
+                self._event.clear()
+    
+    async def _flush(self) -> None:
+        """Grava até max_batch_size documentos pendentes e resolve suas futures"""
+        batch = self._pending[:self.max_batch_size]
+        del self._pending[:self.max_batch_size]
+        if not batch:
+            return
+        
+        errors = {}
+        try:
+            await self.collection.insert_many([document for document, _ in batch], ordered=False)
+        except BulkWriteError as e:
+            # Com ordered=False os demais documentos foram gravados; só os com erro falham
+            for error in e.details.get("writeErrors", []):
+                errors[error["index"]] = WriteError(error.get("errmsg"), error.get("code"), error)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in errors:
+                future.set_exception(errors[index])
+            else:
+                future.set_result(None)
+
+
 class MongoDBCurriculumRepository(ICurriculumRepository):
     """
     Repositório de currículos usando MongoDB com Motor (async)
     """
     
-    def __init__(self, database: AsyncIOMotorDatabase):
+    def __init__(self, database: AsyncIOMotorDatabase, max_batch_size: int = 500, max_latency_ms: float = 5):
         """
         Inicializa o repositório
         
         Args:
             database: Instância do banco de dados MongoDB
+            max_batch_size: Máximo de documentos por insert_many das inserções unitárias
+            max_latency_ms: Espera máxima para agrupar inserções unitárias concorrentes
         """
         self.database = database
         self.documents_collection: AsyncIOMotorCollection = database.curriculum_documents
         self.analyses_collection: AsyncIOMotorCollection = database.curriculum_analyses
         self.audits_collection: AsyncIOMotorCollection = database.processing_audits
+        # Auditorias são gravadas sem confirmação (w=0): ninguém espera pela escrita
+        self._audits_unacknowledged: AsyncIOMotorCollection = database.get_collection(
+            "processing_audits",
+            write_concern=WriteConcern(w=0)
+        )
+        # Texto extraído fica separado dos metadados: consultas de listagem não o carregam
+        self.texts_collection: AsyncIOMotorCollection = database.curriculum_document_text
+        
+        # Contagens filtradas de auditoria por document_id, reaproveitadas por alguns segundos
+        self._audit_count_cache: TTLCache = TTLCache(maxsize=1024, ttl=10)
+        
+        # Listagens de documentos repetidas em sequência são servidas da memória por 1s;
+        # a versão entra na chave e é incrementada a cada escrita em documentos
+        self._document_list_cache: TTLCache = TTLCache(maxsize=64, ttl=1.0)
+        self._documents_version = 0
+        
+        # Inserções unitárias (save_document/save_analysis) viram insert_many
+        self._batch_queues = {
+            name: _BatchQueue(collection, max_batch_size, max_latency_ms)
+            for name, collection in (
+                ("documents", self.documents_collection),
+                ("texts", self.texts_collection),
+                ("analyses", self.analyses_collection),
+            )
+        }
+    
+    def start_batching(self) -> None:
+        """Inicia o agrupamento das inserções unitárias em segundo plano"""
+        for queue in self._batch_queues.values():
+            queue.start()
+    
+    async def stop_batching(self) -> None:
+        """Grava as inserções pendentes e volta a inserir diretamente"""
+        await asyncio.gather(*(queue.stop() for queue in self._batch_queues.values()))
+    
+    async def ping(self) -> bool:
+        """
+        Verifica se o banco de dados está acessível
+        
+        Returns:
+            True se o servidor respondeu ao ping
+        """
+        result = await self.database.command('ping')
+        return bool(result.get("ok"))
+    
+    async def migrate_string_timestamps(self, batch_size: int = 1000) -> int:
+        """
+        Converte em datas BSON os timestamps que registros antigos gravaram como texto ISO
+        
+        O MongoDB compara texto e data em faixas separadas: com os dois tipos no mesmo
+        campo, a ordenação e os filtros por intervalo das listagens ficam incorretos.
+        Só registros que ainda têm algum campo em texto são lidos, então rodar de novo
+        não tem custo de escrita.
+        
+        Args:
+            batch_size: Máximo de atualizações por bulk_write
+            
+        Returns:
+            Número de registros convertidos
+        """
+        counts = await asyncio.gather(*(
+            self._migrate_collection_timestamps(self.database[name], fields, batch_size)
+            for name, fields in _LEGACY_TIMESTAMP_FIELDS.items()
+        ))
+        converted = sum(counts)
+        if converted:
+            logger.info(f"Timestamps em texto convertidos para data: {converted} registros")
+        return converted
+    
+    @staticmethod
+    async def _migrate_collection_timestamps(
+        collection: AsyncIOMotorCollection,
+        fields: Tuple[str, ...],
+        batch_size: int
+    ) -> int:
+        """
+        Converte os timestamps em texto de uma coleção
+        
+        Args:
+            collection: Coleção a migrar
+            fields: Campos de data da coleção
+            batch_size: Máximo de atualizações por bulk_write
+            
+        Returns:
+            Número de registros convertidos
+        """
+        query = {"$or": [{field: {"$type": "string"}} for field in fields]}
+        projection = {field: 1 for field in fields}
+        
+        converted = 0
+        updates = []
+        async for doc in collection.find(query, projection=projection):
+            changes = {}
+            for field in fields:
+                value = doc.get(field)
+                if not isinstance(value, str):
+                    continue
+                try:
+                    changes[field] = datetime.fromisoformat(value)
+                except ValueError:
+                    logger.warning(f"Timestamp inválido em {collection.name}.{field} ({doc['_id']}): {value!r}")
+            if not changes:
+                continue
+            
+            updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": changes}))
+            if len(updates) >= batch_size:
+                await collection.bulk_write(updates, ordered=False)
+                converted += len(updates)
+                updates = []
+        
+        if updates:
+            await collection.bulk_write(updates, ordered=False)
+            converted += len(updates)
+        return converted
+    
+    @staticmethod
+    async def _ensure_id_index(collection: AsyncIOMotorCollection) -> None:
+        """
+        Cria o índice único em id, substituindo o índice não único de versões anteriores
+        
+        O MongoDB não aceita dois índices com as mesmas chaves e opções diferentes, então
+        o índice antigo (id_1) é removido antes. Se já houver ids duplicados, o índice
+        antigo é mantido e o problema registrado, em vez de impedir a inicialização.
+        Cada worker roda isto ao conectar: a troca feita por outro worker ao mesmo tempo
+        não é tratada como erro.
+        
+        Args:
+            collection: Coleção com o campo id
+        """
+        unique = True
+        legacy = (await collection.index_information()).get("id_1")
+        if legacy is not None and not legacy.get("unique"):
+            duplicates = await collection.aggregate([
+                {"$group": {"_id": "$id", "count": {"$sum": 1}}},
+                {"$match": {"count": {"$gt": 1}}},
+                {"$limit": 5},
+            ]).to_list(length=5)
+            if duplicates:
+                logger.error(
+                    f"ids duplicados em {collection.name}, índice único não criado: "
+                    f"{[duplicate['_id'] for duplicate in duplicates]}"
+                )
+                unique = False
+            else:
+                try:
+                    await collection.drop_index("id_1")
+                except OperationFailure as e:
+                    # Outro worker removeu o índice antigo primeiro
+                    if e.code != _INDEX_NOT_FOUND:
+                        raise
+        
+        try:
+            await collection.create_index("id", unique=unique)
+        except OperationFailure as e:
+            # Outro worker está trocando o mesmo índice; o dele prevalece
+            if e.code not in _INDEX_RACE_CODES:
+                raise
+            logger.warning(f"Índice id de {collection.name} sendo trocado por outro processo: {e}")
+    
+    async def ensure_indexes(self) -> None:
+        """Cria os índices usados pelas consultas do repositório, uma chamada por coleção"""
+        await asyncio.gather(
+            self._ensure_id_index(self.documents_collection),
+            self._ensure_id_index(self.analyses_collection),
+            self.documents_collection.create_indexes([
+                # Paginação por intervalo: timestamp decrescente com id como desempate
+                IndexModel([("upload_timestamp", -1), ("id", -1)]),
+            ]),
+            self.texts_collection.create_indexes([
+                IndexModel("document_id"),
+            ]),
+            self.analyses_collection.create_indexes([
+                IndexModel("document_id"),
+                IndexModel("content_hash"),
+                IndexModel([("analysis_timestamp", -1), ("id", -1)]),
+            ]),
+            self.audits_collection.create_indexes([
+                IndexModel([("document_id", 1), ("timestamp", -1), ("id", -1)]),
+                IndexModel([("timestamp", -1), ("id", -1)]),
+            ]),
+        )
     
     async def save_document(self, document: CurriculumDocument) -> None:
         """
@@ -38,20 +407,26 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             document: Documento a ser salvo
         """
         try:
+            # Sem created_at: o ObjectId gerado na inserção já registra o momento da criação
             document_dict = {
                 "id": document.id,
                 "file_name": document.file_name,
                 "file_type": document.file_type.value,
                 "file_size": document.file_size,
-                "extracted_text": document.extracted_text,
-                "upload_timestamp": document.upload_timestamp.isoformat(),
+                "upload_timestamp": document.upload_timestamp,
                 "processed": document.processed,
-                "processing_timestamp": document.processing_timestamp.isoformat() if document.processing_timestamp else None,
-                "error_message": document.error_message,
-                "created_at": datetime.utcnow().isoformat()
+                "processing_timestamp": document.processing_timestamp,
+                "error_message": document.error_message
             }
             
-            await self.documents_collection.insert_one(document_dict)
+            writes = [self._batch_queues["documents"].insert(document_dict)]
+            if document.extracted_text:
+                writes.append(self._batch_queues["texts"].insert({
+                    "document_id": document.id,
+                    "extracted_text": document.extracted_text
+                }))
+            await asyncio.gather(*writes)
+            self._documents_version += 1
             logger.info(f"Documento salvo: {document.id}")
             
         except Exception as e:
@@ -69,38 +444,204 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             Documento encontrado ou None
         """
         try:
-            doc_dict = await self.documents_collection.find_one({"id": document_id})
+            doc_dict, text_dict = await asyncio.gather(
+                self.documents_collection.find_one({"id": document_id}),
+                self.texts_collection.find_one({"document_id": document_id})
+            )
             
             if not doc_dict:
                 return None
             
-            return self._dict_to_document(doc_dict)
+            return self._dict_to_document(doc_dict, self._text_of(doc_dict, text_dict))
             
         except Exception as e:
             logger.error(f"Erro ao buscar documento {document_id}: {e}")
             raise
     
-    async def list_documents(self, limit: int = 100, offset: int = 0) -> List[CurriculumDocument]:
+    async def get_document_meta(self, document_id: str) -> Optional[CurriculumDocument]:
+        """
+        Recupera um documento por ID sem o texto extraído
+        
+        Args:
+            document_id: ID do documento
+            
+        Returns:
+            Documento encontrado (com extracted_text vazio) ou None
+        """
+        try:
+            doc_dict = await self.documents_collection.find_one({"id": document_id}, projection=_NO_TEXT_PROJECTION)
+            
+            if not doc_dict:
+                return None
+            
+            return self._dict_to_document(doc_dict, "")
+            
+        except Exception as e:
+            logger.error(f"Erro ao buscar documento {document_id}: {e}")
+            raise
+    
+    async def get_document_with_analysis(
+        self,
+        document_id: str
+    ) -> Tuple[Optional[CurriculumDocument], Optional[CurriculumAnalysis]]:
+        """
+        Recupera os metadados de um documento e sua análise em uma única consulta ($lookup)
+        
+        Args:
+            document_id: ID do documento
+            
+        Returns:
+            Tupla (documento sem o texto extraído ou None, análise ou None)
+        """
+        try:
+            pipeline = [
+                {"$match": {"id": document_id}},
+                {"$limit": 1},
+                {"$project": _NO_TEXT_PROJECTION},
+                {"$lookup": {
+                    "from": self.analyses_collection.name,
+                    "localField": "id",
+                    "foreignField": "document_id",
+                    "as": "analyses"
+                }},
+            ]
+            results = await self.documents_collection.aggregate(pipeline).to_list(length=1)
+            
+            if not results:
+                return None, None
+            
+            doc_dict = results[0]
+            analyses = doc_dict.pop("analyses")
+            analysis = self._dict_to_analysis(analyses[0]) if analyses else None
+            return self._dict_to_document(doc_dict, ""), analysis
+            
+        except Exception as e:
+            logger.error(f"Erro ao buscar documento com análise {document_id}: {e}")
+            raise
+    
+    async def get_documents(self, document_ids: List[str]) -> Dict[str, CurriculumDocument]:
+        """
+        Recupera vários documentos por ID em uma única consulta
+        
+        Args:
+            document_ids: IDs dos documentos
+            
+        Returns:
+            Dicionário ID -> documento (IDs inexistentes são omitidos)
+        """
+        if not document_ids:
+            return {}
+        
+        try:
+            docs, texts = await asyncio.gather(
+                self.documents_collection.find({"id": {"$in": document_ids}}).to_list(length=len(document_ids)),
+                self._get_texts(document_ids)
+            )
+            
+            return {doc["id"]: self._dict_to_document(doc, self._text_of(doc, texts.get(doc["id"]))) for doc in docs}
+            
+        except Exception as e:
+            logger.error(f"Erro ao buscar documentos em lote: {e}")
+            raise
+    
+    async def list_documents(self, limit: int = 100, after: Optional[Tuple[datetime, str]] = None) -> List[CurriculumDocument]:
         """
-        Lista documentos com paginação
+        Lista documentos com paginação por intervalo, do mais recente ao mais antigo
         
         Args:
             limit: Limite de documentos
-            offset: Offset para paginação
+            after: (upload_timestamp, id) do último documento da página anterior
             
         Returns:
             Lista de documentos
         """
         try:
-            cursor = self.documents_collection.find().skip(offset).limit(limit).sort("upload_timestamp", -1)
+            cursor = self.documents_collection.find(_keyset_query("upload_timestamp", after)).sort(_DOCUMENT_ORDER).limit(limit)
             docs = await cursor.to_list(length=limit)
+            texts = await self._get_texts([doc["id"] for doc in docs])
             
-            return [self._dict_to_document(doc) for doc in docs]
+            return [self._dict_to_document(doc, self._text_of(doc, texts.get(doc["id"]))) for doc in docs]
             
         except Exception as e:
             logger.error(f"Erro ao listar documentos: {e}")
             raise
     
+    async def list_document_infos(self, limit: int = 100, after: Optional[Tuple[datetime, str]] = None) -> List[dict]:
+        """
+        Lista só os metadados dos documentos, na mesma ordem de list_documents
+        
+        O texto extraído (que pode ter megabytes) não sai do banco.
+        
+        Args:
+            limit: Limite de documentos
+            after: (upload_timestamp, id) do último documento da página anterior
+            
+        Returns:
+            Dicionários com os campos de _DOCUMENT_INFO_PROJECTION
+        """
+        key = ("infos", limit, after, self._documents_version)
+        cached = self._document_list_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        try:
+            cursor = self.documents_collection.find(
+                _keyset_query("upload_timestamp", after),
+                projection=_DOCUMENT_INFO_PROJECTION
+            ).sort(_DOCUMENT_ORDER).limit(limit)
+            infos = await cursor.to_list(length=limit)
+            self._document_list_cache[key] = infos
+            return list(infos)
+            
+        except Exception as e:
+            logger.error(f"Erro ao listar documentos: {e}")
+            raise
+    
+    async def list_document_ids(self, limit: int = 100) -> List[str]:
+        """
+        Lista os IDs dos documentos mais recentes, na mesma ordem de list_documents
+        
+        A consulta é coberta pelo índice (upload_timestamp, id): nenhum documento é lido.
+        
+        Args:
+            limit: Limite de IDs
+            
+        Returns:
+            Lista de IDs
+        """
+        key = ("ids", limit, self._documents_version)
+        cached = self._document_list_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        try:
+            cursor = self.documents_collection.find({}, projection={"_id": 0, "id": 1}).sort(_DOCUMENT_ORDER).limit(limit)
+            ids = [doc["id"] async for doc in cursor]
+            self._document_list_cache[key] = ids
+            return list(ids)
+            
+        except Exception as e:
+            logger.error(f"Erro ao listar IDs de documentos: {e}")
+            raise
+    
+    async def iter_documents(self, limit: int = 1000, after: Optional[Tuple[datetime, str]] = None) -> AsyncIterator[CurriculumDocument]:
+        """
+        Itera documentos sob demanda, na mesma ordem de list_documents, sem o texto extraído
+        
+        Args:
+            limit: Limite de documentos
+            after: (upload_timestamp, id) do último documento da página anterior
+            
+        Yields:
+            Documentos (com extracted_text vazio), um por vez
+        """
+        cursor = self.documents_collection.find(
+            _keyset_query("upload_timestamp", after),
+            projection=_NO_TEXT_PROJECTION
+        ).sort(_DOCUMENT_ORDER).limit(limit)
+        async for doc in cursor:
+            yield self._dict_to_document(doc, "")
+    
     async def update_document(self, document: CurriculumDocument) -> None:
         """
         Atualiza um documento existente
@@ -110,18 +651,25 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
         """
         try:
             update_dict = {
-                "extracted_text": document.extracted_text,
                 "processed": document.processed,
-                "processing_timestamp": document.processing_timestamp.isoformat() if document.processing_timestamp else None,
-                "error_message": document.error_message,
-                "updated_at": datetime.utcnow().isoformat()
+                "processing_timestamp": document.processing_timestamp,
+                "error_message": document.error_message
             }
             
-            await self.documents_collection.update_one(
-                {"id": document.id},
-                {"$set": update_dict}
+            await asyncio.gather(
+                # O texto de registros antigos, gravado no próprio documento, é removido
+                self.documents_collection.update_one(
+                    {"id": document.id},
+                    {"$set": update_dict, "$unset": {"extracted_text": ""}, "$currentDate": {"updated_at": True}}
+                ),
+                self.texts_collection.update_one(
+                    {"document_id": document.id},
+                    {"$set": {"extracted_text": document.extracted_text}},
+                    upsert=True
+                )
             )
             
+            self._documents_version += 1
             logger.info(f"Documento atualizado: {document.id}")
             
         except Exception as e:
@@ -139,11 +687,15 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             True se removido, False se não encontrado
         """
         try:
-            result = await self.documents_collection.delete_one({"id": document_id})
+            # Texto e análises associadas são removidos em paralelo; as coleções são independentes
+            result, _, _ = await asyncio.gather(
+                self.documents_collection.delete_one({"id": document_id}),
+                self.texts_collection.delete_many({"document_id": document_id}),
+                self.analyses_collection.delete_many({"document_id": document_id})
+            )
             
             if result.deleted_count > 0:
-                # Remover análises associadas também
-                await self.analyses_collection.delete_many({"document_id": document_id})
+                self._documents_version += 1
                 logger.info(f"Documento removido: {document_id}")
                 return True
             
@@ -161,25 +713,36 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             analysis: Análise a ser salva
         """
         try:
-            analysis_dict = {
-                "id": analysis.id,
-                "document_id": analysis.document_id,
-                "summary": analysis.summary,
-                "skills": analysis.skills,
-                "experience_years": analysis.experience_years,
-                "position_level": analysis.position_level,
-                "education": analysis.education,
-                "analysis_timestamp": analysis.analysis_timestamp.isoformat(),
-                "created_at": datetime.utcnow().isoformat()
-            }
+            analysis_dict = self._analysis_to_dict(analysis)
             
-            await self.analyses_collection.insert_one(analysis_dict)
+            await self._batch_queues["analyses"].insert(analysis_dict)
             logger.info(f"Análise salva: {analysis.id}")
             
         except Exception as e:
             logger.error(f"Erro ao salvar análise {analysis.id}: {e}")
             raise
     
+    async def save_analyses(self, analyses: List[CurriculumAnalysis]) -> None:
+        """
+        Salva várias análises em uma única escrita
+        
+        Args:
+            analyses: Análises a serem salvas
+        """
+        if not analyses:
+            return
+        
+        try:
+            await self.analyses_collection.insert_many(
+                [self._analysis_to_dict(analysis) for analysis in analyses],
+                ordered=False
+            )
+            logger.info(f"Análises salvas: {len(analyses)}")
+            
+        except Exception as e:
+            logger.error(f"Erro ao salvar análises em lote: {e}")
+            raise
+    
     async def get_analysis(self, analysis_id: str) -> Optional[CurriculumAnalysis]:
         """
         Recupera uma análise por ID
@@ -224,19 +787,67 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             logger.error(f"Erro ao buscar análise por documento {document_id}: {e}")
             raise
     
-    async def list_analyses(self, limit: int = 100, offset: int = 0) -> List[CurriculumAnalysis]:
+    async def get_analyses_by_documents(self, document_ids: List[str]) -> Dict[str, CurriculumAnalysis]:
+        """
+        Recupera análises de vários documentos em uma única consulta
+        
+        Args:
+            document_ids: IDs dos documentos
+            
+        Returns:
+            Dicionário ID do documento -> análise
+        """
+        if not document_ids:
+            return {}
+        
+        try:
+            cursor = self.analyses_collection.find({"document_id": {"$in": document_ids}})
+            analyses = await cursor.to_list(length=None)
+            
+            result = {}
+            for analysis_dict in analyses:
+                result.setdefault(analysis_dict["document_id"], self._dict_to_analysis(analysis_dict))
+            return result
+            
+        except Exception as e:
+            logger.error(f"Erro ao buscar análises em lote: {e}")
+            raise
+    
+    async def get_analysis_by_content_hash(self, content_hash: str) -> Optional[CurriculumAnalysis]:
         """
-        Lista análises com paginação
+        Recupera uma análise pelo hash do texto analisado
+        
+        Args:
+            content_hash: Hash do texto extraído do documento
+            
+        Returns:
+            Análise encontrada ou None
+        """
+        try:
+            analysis_dict = await self.analyses_collection.find_one({"content_hash": content_hash})
+            
+            if not analysis_dict:
+                return None
+            
+            return self._dict_to_analysis(analysis_dict)
+            
+        except Exception as e:
+            logger.error(f"Erro ao buscar análise por hash {content_hash}: {e}")
+            raise
+    
+    async def list_analyses(self, limit: int = 100, after: Optional[Tuple[datetime, str]] = None) -> List[CurriculumAnalysis]:
+        """
+        Lista análises com paginação por intervalo, da mais recente à mais antiga
         
         Args:
             limit: Limite de análises
-            offset: Offset para paginação
+            after: (analysis_timestamp, id) da última análise da página anterior
             
         Returns:
             Lista de análises
         """
         try:
-            cursor = self.analyses_collection.find().skip(offset).limit(limit).sort("analysis_timestamp", -1)
+            cursor = self.analyses_collection.find(_keyset_query("analysis_timestamp", after)).sort(_ANALYSIS_ORDER).limit(limit)
             analyses = await cursor.to_list(length=limit)
             
             return [self._dict_to_analysis(analysis) for analysis in analyses]
@@ -245,40 +856,119 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             logger.error(f"Erro ao listar análises: {e}")
             raise
     
+    async def iter_analyses(self, limit: int = 1000, after: Optional[Tuple[datetime, str]] = None) -> AsyncIterator[CurriculumAnalysis]:
+        """
+        Itera análises sob demanda, na mesma ordem de list_analyses
+        
+        Args:
+            limit: Limite de análises
+            after: (analysis_timestamp, id) da última análise da página anterior
+            
+        Yields:
+            Análises, uma por vez
+        """
+        cursor = self.analyses_collection.find(_keyset_query("analysis_timestamp", after)).sort(_ANALYSIS_ORDER).limit(limit)
+        async for analysis in cursor:
+            yield self._dict_to_analysis(analysis)
+    
     async def save_audit(self, audit: ProcessingAudit) -> None:
         """
-        Salva um registro de auditoria
+        Salva um registro de auditoria, sem confirmação (w=0)
         
         Args:
             audit: Registro de auditoria
         """
         try:
-            audit_dict = {
-                "id": audit.id,
-                "action": audit.action,
-                "document_id": audit.document_id,
-                "success": audit.success,
-                "error_message": audit.error_message,
-                "processing_time_ms": audit.processing_time_ms,
-                "timestamp": audit.timestamp.isoformat(),
-                "metadata": audit.metadata or {},
-                "created_at": datetime.utcnow().isoformat()
-            }
+            if audit.timestamp is None:
+                audit.timestamp = datetime.now()
             
-            await self.audits_collection.insert_one(audit_dict)
-            logger.debug(f"Auditoria salva: {audit.id}")
+            # Sem confirmação não há resultado por escrita para repassar: insert_one direto
+            await self._audits_unacknowledged.insert_one(self._audit_to_dict(audit))
+            logger.debug(f"Auditoria enviada: {audit.id}")
             
         except Exception as e:
             logger.error(f"Erro ao salvar auditoria {audit.id}: {e}")
             raise
     
-    async def get_audit_history(self, document_id: str = None, limit: int = 100) -> List[ProcessingAudit]:
+    async def save_audits(self, audits: List[ProcessingAudit]) -> None:
         """
-        Recupera histórico de auditoria
+        Salva vários registros de auditoria em uma única escrita, sem confirmação (w=0)
+        
+        Args:
+            audits: Registros de auditoria
+        """
+        if not audits:
+            return
+        
+        try:
+            now = datetime.now()
+            for audit in audits:
+                if audit.timestamp is None:
+                    audit.timestamp = now
+            
+            await self._audits_unacknowledged.insert_many(
+                [self._audit_to_dict(audit) for audit in audits],
+                ordered=False
+            )
+            logger.debug(f"Auditorias salvas: {len(audits)}")
+            
+        except Exception as e:
+            logger.error(f"Erro ao salvar auditorias em lote: {e}")
+            raise
+    
+    async def count_documents_estimated(self) -> int:
+        """
+        Total aproximado de documentos, lido dos metadados da coleção (sem varredura)
+        
+        Returns:
+            Quantidade estimada de documentos
+        """
+        return await self.documents_collection.estimated_document_count()
+    
+    async def count_analyses_estimated(self) -> int:
+        """
+        Total aproximado de análises, lido dos metadados da coleção (sem varredura)
+        
+        Returns:
+            Quantidade estimada de análises
+        """
+        return await self.analyses_collection.estimated_document_count()
+    
+    async def count_audits(self, document_id: Optional[str] = None) -> int:
+        """
+        Total de registros de auditoria
+        
+        Sem filtro usa a contagem estimada da coleção; com document_id conta pelo
+        índice e guarda o resultado por 10 segundos.
+        
+        Args:
+            document_id: ID do documento (opcional, para filtrar)
+            
+        Returns:
+            Quantidade de registros
+        """
+        if not document_id:
+            return await self.audits_collection.estimated_document_count()
+        
+        count = self._audit_count_cache.get(document_id)
+        if count is None:
+            count = await self.audits_collection.count_documents({"document_id": document_id})
+            self._audit_count_cache[document_id] = count
+        return count
+    
+    async def get_audit_history(
+        self,
+        document_id: str = None,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, str]] = None
+    ) -> List[ProcessingAudit]:
+        """
+        Recupera histórico de auditoria, do mais recente ao mais antigo
         
         Args:
             document_id: ID do documento (opcional, para filtrar)
             limit: Limite de registros
+            after: (timestamp, id) do último registro da página anterior
             
         Returns:
             Lista de registros de auditoria
@@ -288,7 +978,7 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             if document_id:
                 query["document_id"] = document_id
             
-            cursor = self.audits_collection.find(query).limit(limit).sort("timestamp", -1)
+            cursor = self.audits_collection.find(_keyset_query("timestamp", after, query)).sort(_AUDIT_ORDER).limit(limit)
             audits = await cursor.to_list(length=limit)
             
             return [self._dict_to_audit(audit) for audit in audits]
@@ -297,19 +987,61 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             logger.error(f"Erro ao buscar histórico de auditoria: {e}")
             raise
     
-    def _dict_to_document(self, doc_dict: dict) -> CurriculumDocument:
-        """Converte dict do MongoDB para CurriculumDocument"""
-        from ...domain.value_objects.curriculum_values import FileType
-        
+    def _analysis_to_dict(self, analysis: CurriculumAnalysis) -> dict:
+        """Converte CurriculumAnalysis para dict do MongoDB"""
+        return {
+            "id": analysis.id,
+            "document_id": analysis.document_id,
+            "summary": analysis.summary,
+            "skills": analysis.skills,
+            "experience_years": analysis.experience_years,
+            "position_level": analysis.position_level,
+            "education": analysis.education,
+            "analysis_timestamp": analysis.analysis_timestamp,
+            "content_hash": analysis.content_hash
+        }
+    
+    def _audit_to_dict(self, audit: ProcessingAudit) -> dict:
+        """Converte ProcessingAudit para dict do MongoDB"""
+        audit_dict = {
+            "id": audit.id,
+            "action": audit.action,
+            "document_id": audit.document_id,
+            "success": audit.success,
+            "error_message": audit.error_message,
+            "processing_time_ms": audit.processing_time_ms,
+            "timestamp": audit.timestamp
+        }
+        # Metadados vazios não são gravados
+        if audit.metadata:
+            audit_dict["metadata"] = audit.metadata
+        return audit_dict
+    
+    async def _get_texts(self, document_ids: List[str]) -> Dict[str, dict]:
+        """Busca os textos extraídos de vários documentos, por ID do documento"""
+        if not document_ids:
+            return {}
+        cursor = self.texts_collection.find({"document_id": {"$in": document_ids}}, projection={"_id": 0})
+        return {text["document_id"]: text async for text in cursor}
+    
+    @staticmethod
+    def _text_of(doc_dict: dict, text_dict: Optional[dict]) -> str:
+        """Texto extraído do documento; registros antigos o guardam no próprio documento"""
+        if text_dict is not None:
+            return text_dict["extracted_text"]
+        return doc_dict.get("extracted_text", "")
+    
+    def _dict_to_document(self, doc_dict: dict, extracted_text: str) -> CurriculumDocument:
+        """Converte dict do MongoDB (sem o texto, guardado à parte) para CurriculumDocument"""
         return CurriculumDocument(
             id=doc_dict["id"],
             file_name=doc_dict["file_name"],
-            file_type=FileType(doc_dict["file_type"]),
+            file_type=_FILETYPE_CACHE[doc_dict["file_type"]],
             file_size=doc_dict["file_size"],
-            extracted_text=doc_dict["extracted_text"],
-            upload_timestamp=datetime.fromisoformat(doc_dict["upload_timestamp"]),
+            extracted_text=extracted_text,
+            upload_timestamp=_as_datetime(doc_dict["upload_timestamp"]),
             processed=doc_dict["processed"],
-            processing_timestamp=datetime.fromisoformat(doc_dict["processing_timestamp"]) if doc_dict["processing_timestamp"] else None,
+            processing_timestamp=_as_datetime(doc_dict["processing_timestamp"]),
             error_message=doc_dict["error_message"]
         )
     
@@ -323,7 +1055,8 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             experience_years=analysis_dict["experience_years"],
             position_level=analysis_dict["position_level"],
             education=analysis_dict["education"],
-            analysis_timestamp=datetime.fromisoformat(analysis_dict["analysis_timestamp"])
+            analysis_timestamp=_as_datetime(analysis_dict["analysis_timestamp"]),
+            content_hash=analysis_dict.get("content_hash")
         )
     
     def _dict_to_audit(self, audit_dict: dict) -> ProcessingAudit:
@@ -335,8 +1068,8 @@ class MongoDBCurriculumRepository(ICurriculumRepository):
             success=audit_dict["success"],
             error_message=audit_dict["error_message"],
             processing_time_ms=audit_dict["processing_time_ms"],
-            timestamp=datetime.fromisoformat(audit_dict["timestamp"]),
-            metadata=audit_dict.get("metadata", {})
+            timestamp=_as_datetime(audit_dict["timestamp"]),
+            metadata=audit_dict.get("metadata")
         )
 
 
@@ -345,18 +1078,44 @@ class DatabaseConnection:
     Classe para gerenciar conexão com MongoDB
     """
     
-    def __init__(self, connection_string: str, database_name: str):
+    def __init__(
+        self,
+        connection_string: str,
+        database_name: str,
+        max_pool_size: int = 50,
+        min_pool_size: int = 5,
+        server_selection_timeout_ms: int = 2000,
+        max_idle_time_ms: int = 300_000,
+        wait_queue_timeout_ms: int = 2000,
+        insert_batch_size: int = 500,
+        insert_max_latency_ms: float = 5
+    ):
         """
         Inicializa conexão
         
         Args:
             connection_string: String de conexão MongoDB
             database_name: Nome do banco de dados
+            max_pool_size: Máximo de conexões no pool do cliente
+            min_pool_size: Conexões mantidas abertas no pool
+            server_selection_timeout_ms: Tempo máximo para encontrar um servidor disponível
+            max_idle_time_ms: Tempo ocioso após o qual uma conexão do pool é fechada
+            wait_queue_timeout_ms: Espera máxima por uma conexão livre quando o pool está cheio
+            insert_batch_size: Máximo de documentos por lote de inserções unitárias
+            insert_max_latency_ms: Espera máxima para agrupar inserções unitárias
         """
         self.connection_string = connection_string
         self.database_name = database_name
+        self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
+        self.server_selection_timeout_ms = server_selection_timeout_ms
+        self.max_idle_time_ms = max_idle_time_ms
+        self.wait_queue_timeout_ms = wait_queue_timeout_ms
+        self.insert_batch_size = insert_batch_size
+        self.insert_max_latency_ms = insert_max_latency_ms
         self.client: Optional[AsyncIOMotorClient] = None
         self.database: Optional[AsyncIOMotorDatabase] = None
+        self.repository: Optional[MongoDBCurriculumRepository] = None
     
     async def connect(self) -> AsyncIOMotorDatabase:
         """
@@ -366,13 +1125,35 @@ class DatabaseConnection:
             Instância do banco de dados
         """
         if self.client is None:
-            self.client = AsyncIOMotorClient(self.connection_string)
+            # Sem as extensões C, toda codificação/decodificação BSON roda em Python
+            if not (bson.has_c() and pymongo.has_c()):
+                logger.warning("Extensões C do PyMongo indisponíveis; BSON será processado em Python puro")
+            
+            self.client = AsyncIOMotorClient(
+                self.connection_string,
+                maxPoolSize=self.max_pool_size,
+                minPoolSize=self.min_pool_size,
+                serverSelectionTimeoutMS=self.server_selection_timeout_ms,
+                maxIdleTimeMS=self.max_idle_time_ms,
+                # Falha rápido em vez de enfileirar requisições sem limite quando o pool esgota
+                waitQueueTimeoutMS=self.wait_queue_timeout_ms,
+                retryWrites=True
+            )
             self.database = self.client[self.database_name]
             
             # Testar conexão
             try:
                 await self.client.admin.command('ping')
                 logger.info(f"Conectado ao MongoDB: {self.database_name}")
+                self.repository = MongoDBCurriculumRepository(
+                    self.database,
+                    max_batch_size=self.insert_batch_size,
+                    max_latency_ms=self.insert_max_latency_ms
+                )
+                # Registros antigos com timestamps em texto são convertidos antes de servir listagens
+                await self.repository.migrate_string_timestamps()
+                await self.repository.ensure_indexes()
+                self.repository.start_batching()
             except Exception as e:
                 logger.error(f"Erro ao conectar MongoDB: {e}")
                 raise
@@ -382,6 +1163,9 @@ class DatabaseConnection:
     async def disconnect(self) -> None:
         """Desconecta do banco de dados"""
         if self.client is not None:
+            if self.repository is not None:
+                await self.repository.stop_batching()
+                self.repository = None
             self.client.close()
             self.client = None
             self.database = None
@@ -394,7 +1178,7 @@ class DatabaseConnection:
         Returns:
             Repositório configurado
         """
-        if self.database is None:
+        if self.repository is None:
             raise RuntimeError("Database não está conectado")
         
-        return MongoDBCurriculumRepository(self.database)
\ No newline at end of file
+        return self.repository
\ No newline at end of file
@@ -29,6 +29,8 @@ class AnalysisResponse(BaseModel):
 class QueryAnalysisRequest(BaseModel):
     """Request para análise de query"""
     query: str = Field(..., description="Query para análise de matching")
+    no_cache: bool = Field(False, description="Ignora resultados de matching em cache")
+    top_k: Optional[int] = Field(None, ge=1, description="Quantidade máxima de candidatos retornados")
 
 
 class MatchResult(BaseModel):
@@ -61,9 +63,9 @@ class DocumentInfo(BaseModel):
 class DocumentListResponse(BaseModel):
     """Response da listagem de documentos"""
     documents: List[DocumentInfo]
-    total: int
-    offset: int
+    total: int = Field(..., description="Total aproximado de documentos")
     limit: int
+    next_cursor: Optional[str] = Field(None, description="Valor de after para a próxima página (None na última)")
 
 
 class ProcessingAuditInfo(BaseModel):
@@ -81,7 +83,8 @@ class ProcessingAuditInfo(BaseModel):
 class AuditHistoryResponse(BaseModel):
     """Response do histórico de auditoria"""
     audits: List[ProcessingAuditInfo]
-    total: int
+    total: int = Field(..., description="Total de registros (aproximado sem filtro de documento)")
+    next_cursor: Optional[str] = Field(None, description="Valor de after para a próxima página (None na última)")
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,51 @@
+"""
+Testes dos value objects de currículo
+"""
+
+import pytest
+
+from src.domain.value_objects.curriculum_values import TechnicalSkillSet
+
+
+def _baseline_category(skill: str) -> str:
+    """Categorização original (substring, em ordem de prioridade), usada como referência"""
+    skill_lower = skill.lower()
+
+    languages = ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'php', 'ruby']
+    frameworks = ['react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring', 'express']
+    databases = ['postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite']
+    devops = ['docker', 'kubernetes', 'aws', 'azure', 'gcp', 'terraform', 'jenkins']
+
+    if any(lang in skill_lower for lang in languages):
+        return "Linguagem de Programação"
+    elif any(fw in skill_lower for fw in frameworks):
+        return "Framework"
+    elif any(db in skill_lower for db in databases):
+        return "Banco de Dados"
+    elif any(devops_tool in skill_lower for devops_tool in devops):
+        return "DevOps"
+    else:
+        return "Geral"
+
+
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Go", "Rust", "PHP", "Ruby",
+    "React", "React Native", "Angular", "AngularJS", "Vue", "Vue.js", "Django", "Flask",
+    "FastAPI", "Spring", "Spring Boot", "Express", "Express.js", "Node.js", "Next.js",
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "SQLite", "SQL Server",
+    "Docker", "Kubernetes", "AWS", "AWS Lambda", "Azure", "GCP", "Terraform", "Jenkins",
+    "Git", "Linux", "GraphQL", "Machine Learning", "Pandas", "NumPy", "Ruby on Rails",
+    "Google Cloud", "CI/CD", "docker-compose", "Python/Django", "Golang",
+]
+
+
+@pytest.mark.parametrize("skill", SKILLS)
+def test_skill_category_matches_baseline(skill):
+    skill_set = TechnicalSkillSet([skill])
+
+    assert [s.category for s in skill_set.skills] == [_baseline_category(skill)]
+
+
+def test_skill_set_equality_ignores_order():
+    assert TechnicalSkillSet(["Python", "python", " Go "]) == TechnicalSkillSet(["Go", "Python", "python"])
+    assert hash(TechnicalSkillSet(["Go", "Python"])) == hash(TechnicalSkillSet(["Python", "Go"]))
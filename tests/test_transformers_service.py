@@ -0,0 +1,31 @@
+"""
+Testes do serviço de inteligência (regras e palavras-chave)
+"""
+
+import pytest
+
+from src.infrastructure.llm.patterns import EDUCATION_KEYWORDS
+from src.infrastructure.llm.transformers_service import TransformersIntelligenceService
+
+
+@pytest.fixture(scope="module")
+def service():
+    return TransformersIntelligenceService()
+
+
+@pytest.mark.parametrize("text", [
+    "Cursos Superiores em TI",
+    "Bacharelado em Ciência da Computação pela Universidade Federal",
+    "Doutorado em Física",
+    "Mestre e Doutor em engenharias pelo Instituto",
+    "Tecnólogo superior, faculdade, graduado, PhD",
+    "Sem formação informada",
+])
+def test_education_uses_substring_keywords(service, text):
+    # Como a implementação original: palavras-chave contidas no texto, até 3
+    text_lower = text.lower()
+    expected = [keyword.title() for keyword in EDUCATION_KEYWORDS if keyword in text_lower][:3]
+
+    _, education, _ = service._scan_keywords(text_lower)
+
+    assert (education.split(", ") if education else []) == expected